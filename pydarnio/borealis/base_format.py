@@ -41,7 +41,6 @@ import h5py
 import numpy as np
 
 from collections import OrderedDict
-from datetime import datetime
 from typing import Callable, List
 
 from pydarnio import borealis_exceptions
@@ -513,8 +512,13 @@ class BaseFormat():
         This reshapes them to the correct dimensions. Some formats may not
         have this issue, in which case this function does not need to be
         updated by the child class.
+
+        Only the record dictionaries are copied, so the records passed in are
+        left unchanged without copying all of their data; reshaped fields
+        are views of the original arrays.
         """
-        new_records = copy.deepcopy(records)
+        new_records = OrderedDict((key, dict(record))
+                                  for key, record in records.items())
         return new_records
 
     @staticmethod
@@ -1063,25 +1067,34 @@ class BaseFormat():
         # some fields are linear in site style and need to be reshaped.
         data_dict = cls.reshape_site_arrays(data_dict)
 
+        # The field definitions are built from the version's field
+        # dictionaries on every call, so only look them up once.
+        single_element_types = cls.single_element_types()
+        array_dtypes = cls.array_dtypes()
+        unshared_fields = cls.unshared_fields()
+
         # write shared fields to dictionary
         first_key = list(data_dict.keys())[0]
         for field in cls.shared_fields():
-            new_data_dict[field] = data_dict[first_key][field]
+            # copied so the arrays do not share data with the records
+            new_data_dict[field] = copy.deepcopy(data_dict[first_key][field])
 
         # write array specific fields using the given functions.
+        array_specific_fields_generate = cls.array_specific_fields_generate()
         for field in cls.array_specific_fields():
-            new_data_dict[field] = cls.array_specific_fields_generate(
-                )[field](data_dict)
+            new_data_dict[field] = array_specific_fields_generate[field](
+                data_dict)
 
         # write the unshared fields, initializing empty arrays to start.
         temp_array_dict = dict()
 
         # get array dims of the unshared fields arrays
         field_dimensions = {}
-        for field in cls.unshared_fields():
+        unshared_fields_dims = cls.unshared_fields_dims_array()
+        for field in unshared_fields:
             d = [dimension_function(data_dict) for
                     dimension_function in
-                    cls.unshared_fields_dims_array()[field]]
+                    unshared_fields_dims[field]]
             
             dims = []
             for dim in d:
@@ -1098,10 +1111,10 @@ class BaseFormat():
             array_dims = [num_records] + dims
             array_dims = tuple(array_dims)
 
-            if field in cls.single_element_types():
-                datatype = cls.single_element_types()[field]
+            if field in single_element_types:
+                datatype = single_element_types[field]
             else:  # field in array_dtypes
-                datatype = cls.array_dtypes()[field]
+                datatype = array_dtypes[field]
             if datatype == str:
                 # unicode type needs to be explicitly set to have
                 # multiple chars (256)
@@ -1121,7 +1134,7 @@ class BaseFormat():
         # iterate through the records, filling the unshared and array only
         # fields
         for rec_idx, k in enumerate(data_dict.keys()):
-            for field in cls.unshared_fields():  # all unshared fields
+            for field in unshared_fields:  # all unshared fields
                 empty_array = temp_array_dict[field]
                 if type(data_dict[first_key][field]) == np.ndarray:
                     # only fill the correct length, appended NaNs occur for
@@ -1141,6 +1154,35 @@ class BaseFormat():
 
         return new_data_dict
 
+    @staticmethod
+    def site_record_keys(sqn_timestamps: np.ndarray) -> List[str]:
+        """
+        Gives the site record keys of records from their first sequence
+        timestamps, for all records at once.
+
+        The keys are formatted the same way as is done in datawrite on site,
+        in ms since epoch from the timestamp as a datetime (rounded to the
+        microsecond, half to even, as by datetime.utcfromtimestamp).
+
+        Parameters
+        ----------
+        sqn_timestamps: np.ndarray
+            Timestamp of the first sequence of each record, in seconds since
+            epoch
+
+        Returns
+        -------
+        List[str]
+            Record keys in the same order as the timestamps
+        """
+        timestamps = np.asarray(sqn_timestamps, dtype=np.float64)
+        seconds = np.trunc(timestamps)
+        microseconds = np.round((timestamps - seconds) * 1e6)
+        total_microseconds = seconds.astype(np.int64) * 1000000 + \
+            microseconds.astype(np.int64)
+        milliseconds = np.trunc(total_microseconds / 1e6 * 1000)
+        return [str(key) for key in milliseconds.astype(np.int64).tolist()]
+
     @classmethod
     def _array_to_site(cls, data_dict: dict) -> OrderedDict:
         """
@@ -1180,39 +1222,48 @@ class BaseFormat():
                 'restructureable from site to array style or vice versa.'
                 ''.format(cls.__name__))
 
-        timestamp_dict = OrderedDict()
-        for record_num, seq_timestamp in \
-                enumerate(data_dict["sqn_timestamps"]):
-            # format dictionary key in the same way it is done
-            # in datawrite on site
-            seq_datetime = datetime.utcfromtimestamp(seq_timestamp[0])
-            epoch = datetime.utcfromtimestamp(0)
-            key = str(int((seq_datetime - epoch).total_seconds() * 1000))
+        # The field definitions are built from the version's field
+        # dictionaries on every call, so only look them up once rather
+        # than for every field of every record.
+        shared_fields = cls.shared_fields()
+        site_specific_fields = cls.site_specific_fields()
+        site_specific_fields_generate = cls.site_specific_fields_generate()
+        unshared_fields = cls.unshared_fields()
+        unshared_fields_dims = cls.unshared_fields_dims_site()
+        single_element_types = cls.single_element_types()
+        array_dtypes = cls.array_dtypes()
+
+        # format dictionary keys in the same way it is done
+        # in datawrite on site
+        record_keys = cls.site_record_keys(
+            np.asarray(data_dict["sqn_timestamps"])[:, 0])
 
+        timestamp_dict = OrderedDict()
+        for record_num, key in enumerate(record_keys):
             timestamp_dict[key] = dict()
             # populate shared fields in each record,
-            for field in cls.shared_fields():
+            for field in shared_fields:
                 timestamp_dict[key][field] = data_dict[field]
 
             # populate site specific fields using given functions
             # that take both the arrays data and the record number
-            for field in cls.site_specific_fields():
-                timestamp_dict[key][field] = cls.site_specific_fields_generate(
-                    )[field](data_dict, record_num)
+            for field in site_specific_fields:
+                timestamp_dict[key][field] = site_specific_fields_generate[
+                    field](data_dict, record_num)
 
-            for field in cls.unshared_fields():
-                if field in cls.single_element_types():
-                    datatype = cls.single_element_types()[field]
+            for field in unshared_fields:
+                if field in single_element_types:
+                    datatype = single_element_types[field]
                     # field is not an array, single element per record.
                     # unshared_field_dims_site should give empty list.
                     timestamp_dict[key][field] = datatype(data_dict[field]
                                                           [record_num])
                 else:  # field in array_dtypes
-                    datatype = cls.array_dtypes()[field]
+                    datatype = array_dtypes[field]
                     # need to get the dims correct, not always equal to the max
                     site_dims = [dimension_function(data_dict, record_num)
                                  for dimension_function in
-                                 cls.unshared_fields_dims_site()[field]]
+                                 unshared_fields_dims[field]]
                     dims = []
                     for dim in site_dims:
                         if isinstance(dim,list):
@@ -1257,6 +1308,9 @@ class BaseFormat():
         to the format and updated in the child class.
         """
         records = OrderedDict()
+        # memory types and decoded strings of attributes, shared by all records
+        mtypes = {}
+        strings = {}
         with h5py.File(filename, 'r') as f:
             record_keys = sorted(list(f.keys()))
             for rec_key in record_keys:
@@ -1266,38 +1320,132 @@ class BaseFormat():
                 # Get the datasets (vector fields)
                 datasets = list(group.keys())
                 for dset_name in datasets:
-                    dset = group[dset_name]
-                    if 'strtype' in dset.attrs:     # string type, requires some handling
-                        itemsize = dset.attrs['itemsize']
-                        data = dset[:].view(dtype=(np.str_, itemsize))
-                    else:
-                        data = dset[:]      # non-string, can simply load
-                    rec_dict[dset_name] = data
+                    rec_dict[dset_name] = cls.read_dataset(group, dset_name)
 
                 # Get the attributes (scalar fields)
-                attribute_dict = {}
-                for k, v in group.attrs.items():
-                    if k in ['CLASS', 'TITLE', 'VERSION', 'DEEPDISH_IO_VERSION', 'PYTABLES_FORMAT_VERSION']:
-                        continue
-                    elif isinstance(v, bytes):
-                        if v.itemsize == 0:
-                            attribute_dict[k] = ''
-                        else:
-                            attribute_dict[k] = v.tobytes().decode('utf-8')
-                    elif isinstance(v, h5py.Empty):
-                        dtype = v.dtype.type
-                        data = dtype()
-                        if isinstance(data, bytes):
-                            data = data.decode('utf-8')
-                        attribute_dict[k] = data
-                    else:
-                        attribute_dict[k] = v
-                rec_dict.update(attribute_dict)
+                rec_dict.update(cls.read_attributes(group, mtypes, strings))
 
                 records[rec_key] = rec_dict
 
         return records
 
+    @staticmethod
+    def read_attributes(parent: h5py.Group, mtypes: dict = None,
+                        strings: dict = None) -> dict:
+        """
+        Reads all attributes (scalar fields) of a Borealis HDF5 group or file.
+
+        The attributes are visited in a single low-level iteration over the
+        object, rather than listing the names and looking up every attribute
+        again by name. Bookkeeping attributes written by PyTables and deepdish
+        are skipped, and byte strings are returned as unicode strings.
+
+        The caches can be shared between the records of a site file, whose
+        records have the same attribute names and many identical string
+        values (git hash, experiment name, station, comments), so each
+        name and string is only decoded once per file.
+
+        Parameters
+        ----------
+        parent: h5py.Group
+            Open group, or file, to read the attributes of
+        mtypes: dict
+            Optional cache of HDF5 memory types keyed by numpy dtype, which
+            can be shared between calls so the types are only created once
+            per file. Default None, a new cache is used.
+        strings: dict
+            Optional cache of decoded attribute names and string values, keyed
+            by their bytes. Default None, a new cache is used.
+
+        Returns
+        -------
+        dict
+            Attribute names and their values.
+        """
+        if mtypes is None:
+            mtypes = {}
+        if strings is None:
+            strings = {}
+        attribute_dict = {}
+
+        def read_attribute(name: bytes):
+            k = strings.get(name)
+            if k is None:
+                k = strings[name] = name.decode('utf-8')
+            if k in ['CLASS', 'TITLE', 'VERSION', 'DEEPDISH_IO_VERSION', 'PYTABLES_FORMAT_VERSION']:
+                return
+            attr_id = h5py.h5a.open(parent.id, name)
+            dtype = attr_id.dtype
+            shape = attr_id.shape
+            if shape is None:   # empty dataspace
+                data = dtype.type()
+                if isinstance(data, bytes):
+                    data = data.decode('utf-8')
+                attribute_dict[k] = data
+                return
+
+            mtype = mtypes.get(dtype)
+            if mtype is None:
+                mtype = mtypes[dtype] = h5py.h5t.py_create(dtype)
+            if dtype.subdtype is not None:
+                dtype, subshape = dtype.subdtype
+                shape = shape + subshape
+            v = np.zeros(shape, dtype=dtype)
+            attr_id.read(v, mtype=mtype)
+
+            string_info = h5py.h5t.check_string_dtype(dtype)
+            if string_info is not None and string_info.length is None:
+                # variable length strings, read as bytes objects
+                v = np.array([b.decode('utf-8', 'surrogateescape')
+                              for b in v.flat], dtype=dtype).reshape(v.shape)
+            if v.ndim == 0:
+                v = v[()]
+
+            if isinstance(v, bytes):
+                if v.itemsize == 0:
+                    attribute_dict[k] = ''
+                else:
+                    value = strings.get(v)
+                    if value is None:
+                        value = strings[v] = v.tobytes().decode('utf-8')
+                    attribute_dict[k] = value
+            else:
+                attribute_dict[k] = v
+
+        h5py.h5a.iterate(parent.id, read_attribute)
+        return attribute_dict
+
+    @staticmethod
+    def read_dataset(parent: h5py.Group, dset_name: str) -> np.ndarray:
+        """
+        Reads a whole dataset from a Borealis HDF5 group or file.
+
+        The dataset is opened and read through the low-level h5py interface,
+        which avoids building a high-level Dataset and parsing a selection
+        for every field of every record.
+
+        Parameters
+        ----------
+        parent: h5py.Group
+            Open group, or file, containing the dataset
+        dset_name: str
+            Name of the dataset to read
+
+        Returns
+        -------
+        np.ndarray
+            The data of the dataset. String type datasets, which are stored
+            as bytes, are returned as unicode strings.
+        """
+        dset_id = h5py.h5d.open(parent.id, dset_name.encode('utf-8'))
+        data = np.empty(dset_id.shape, dtype=dset_id.dtype)
+        if data.size > 0:
+            dset_id.read(h5py.h5s.ALL, h5py.h5s.ALL, data)
+        if h5py.h5a.exists(dset_id, b'strtype'):   # string type, requires some handling
+            itemsize = h5py.Dataset(dset_id).attrs['itemsize']
+            data = data.view(dtype=(np.str_, itemsize))
+        return data
+
     @classmethod
     def read_arrays(cls, filename: str) -> OrderedDict:
         """
@@ -1329,33 +1477,10 @@ class BaseFormat():
             # Get the datasets (vector fields)
             array_names = sorted(list(f.keys()))
             for array_name in array_names:
-                dset = f[array_name]
-                if 'strtype' in dset.attrs:  # string type, requires some handling
-                    itemsize = dset.attrs['itemsize']
-                    data = dset[:].view(dtype=(np.str_, itemsize))
-                else:
-                    data = dset[:]  # non-string, can simply load
-                arrays[array_name] = data
+                arrays[array_name] = cls.read_dataset(f, array_name)
 
             # Get the attributes (scalar fields)
-            attribute_dict = {}
-            for k, v in f.attrs.items():
-                if k in ['CLASS', 'TITLE', 'VERSION', 'DEEPDISH_IO_VERSION', 'PYTABLES_FORMAT_VERSION']:
-                    continue
-                elif isinstance(v, bytes):
-                    if v.itemsize == 0:
-                        attribute_dict[k] = ''
-                    else:
-                        attribute_dict[k] = v.tobytes().decode('utf-8')
-                elif isinstance(v, h5py.Empty):
-                    dtype = v.dtype.type
-                    data = dtype()
-                    if isinstance(data, bytes):
-                        data = data.decode('utf-8')
-                    attribute_dict[k] = data
-                else:
-                    attribute_dict[k] = v
-            arrays.update(attribute_dict)
+            arrays.update(cls.read_attributes(f))
 
         return arrays
 
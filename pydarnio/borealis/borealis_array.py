@@ -159,8 +159,15 @@ class BorealisArrayRead():
         A sorted list of the set of record names in the HDF5 file read.
         These correspond to Borealis file record write times (in ms), and
         are equal to the group names in the site file types.
+
+        The names are made from the sequence timestamps, without
+        restructuring the arrays into records.
         """
-        return sorted(list(self.records.keys()))
+        if not self.format.is_restructureable():
+            # raises the restructure error
+            return sorted(list(self.records.keys()))
+        return sorted(set(self.format.site_record_keys(
+            self.arrays['sqn_timestamps'][:, 0])))
 
     @property
     def records(self):
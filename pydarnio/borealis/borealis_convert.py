@@ -43,8 +43,10 @@ Update noise values in SDarn fields when these can be calculated.
 import logging
 import numpy as np
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Union
+from functools import partial
+from typing import Callable, Union
 
 from pydarnio import (borealis_exceptions, BorealisRead, SDarnWrite, dict2dmap)
 
@@ -96,6 +98,11 @@ code_to_stid = {
     "ekb": 512,
 }
 
+# Maximum of the int16 SDARN DMap data, which data is scaled to, and its
+# square, which correlations of that data are scaled to.
+INT16_MAX = int(np.iinfo(np.int16).max)
+INT16_MAX_SQ = INT16_MAX**2
+
 
 class BorealisConvert(BorealisRead):
     """
@@ -153,6 +160,8 @@ class BorealisConvert(BorealisRead):
     scaling_factor: int
         The scaling factor the data has been multiplied by before converting
         to integers for the corresponding dmap format.
+    processes: int
+        The number of worker processes the records are converted with.
     """
 
     __allowed_conversions = {'rawacf': 'rawacf', 'bfiq': 'iqdat'}
@@ -160,7 +169,7 @@ class BorealisConvert(BorealisRead):
     def __init__(self, borealis_filename: str, borealis_filetype: str,
                  sdarn_filename: str, borealis_slice_id: int = None,
                  borealis_file_structure: Union[str, None] = None,
-                 scaling_factor: int = 1):
+                 scaling_factor: int = 1, processes: int = 1):
         """
         Convert HDF5 Borealis records to a given SDARN file with DMap format.
 
@@ -188,13 +197,26 @@ class BorealisConvert(BorealisRead):
             can accommodate. This value is provided to multiply the data
             by before converting to int, to allow the noise floor to be
             seen, for instance.
+        processes : int
+            The number of worker processes to convert the records with.
+            Records are independent of each other, so files with many records
+            can be converted in parallel. Default 1, converting in this
+            process.
 
         Raises
         ------
+        ValueError
+            If processes is not a positive integer.
         BorealisStructureError
         BorealisConversionTypesError
         ConvertFileOverWriteError
         """
+        # checked before the file is read; True and False are not counts
+        if isinstance(processes, bool) or \
+                not isinstance(processes, (int, np.integer)) or \
+                processes < 1:
+            raise ValueError('processes must be a positive integer, not '
+                             '{!r}'.format(processes))
 
         super(BorealisConvert, self).__init__(borealis_filename,
                                               borealis_filetype,
@@ -208,13 +230,16 @@ class BorealisConvert(BorealisRead):
         #   records : dict (of data)
         #   arrays : dict (of data)
 
+        # records of an array file are restructured on every access of
+        # records, so they are only taken once
         self.borealis_records = self.records
         self.sdarn_filename = sdarn_filename
         self.borealis_filename = self.filename
 
         try:
-            first_key = list(self.records.keys())[0]
-            self._borealis_slice_id = self.records[first_key]['slice_id']
+            first_key = list(self.borealis_records.keys())[0]
+            self._borealis_slice_id = \
+                self.borealis_records[first_key]['slice_id']
         except KeyError as kerr:
             if borealis_slice_id is not None:
                 self._borealis_slice_id = int(borealis_slice_id)
@@ -227,6 +252,7 @@ class BorealisConvert(BorealisRead):
         self._sdarn_dmap_records = {}
         self._sdarn_dict = {}
         self._scaling_factor = scaling_factor
+        self._processes = int(processes)
         try:
             self._sdarn_filetype = self.__allowed_conversions[
                     self.borealis_filetype]
@@ -296,6 +322,13 @@ class BorealisConvert(BorealisRead):
         """
         return self._scaling_factor
 
+    @property
+    def processes(self):
+        """
+        The number of worker processes the records are converted with.
+        """
+        return self._processes
+
     def _write_to_sdarn(self) -> str:
         """
         Write the Borealis records as SDARN DMap records to a file using
@@ -477,13 +510,41 @@ class BorealisConvert(BorealisRead):
 
         return True
 
+    def _convert_records(self, convert_record: Callable) -> list:
+        """
+        Converts every Borealis record with the given record conversion
+        function, in worker processes if more than one was requested.
+
+        Parameters
+        ----------
+        convert_record: Callable
+            The static record conversion function, _convert_bfiq_record or
+            _convert_rawacf_record.
+
+        Returns
+        -------
+        recs, the SDARN record dictionaries of all records, in record order
+        """
+        convert = partial(convert_record, self.borealis_slice_id,
+                          origin_string=self.borealis_filename,
+                          scaling_factor=self.scaling_factor)
+        records = self.borealis_records.items()
+        # a pool is only worth starting if there is work to share
+        if self.processes > 1 and len(records) > 1:
+            with ProcessPoolExecutor(max_workers=self.processes) as executor:
+                record_dict_lists = list(executor.map(convert, records))
+        else:
+            record_dict_lists = map(convert, records)
+        return [sdarn_record for record_dict_list in record_dict_lists
+                for sdarn_record in record_dict_list]
+
     def _convert_bfiq_to_iqdat(self):
         """
         Conversion for bfiq to iqdat SDARN DMap records.
 
         See Also
         --------
-        __convert_bfiq_record
+        _convert_bfiq_record
         https://superdarn.github.io/rst/superdarn/src.doc/rfc/0027.html
         https://borealis.readthedocs.io/en/master/
         BorealisBfiq
@@ -509,24 +570,17 @@ class BorealisConvert(BorealisRead):
         dmap_recs, the records converted to DMap format
         """
         try:
-            recs = []
-            for record in self.borealis_records.items():
-                record_dict_list = \
-                        self.__convert_bfiq_record(self.borealis_slice_id,
-                                                   record,
-                                                   self.borealis_filename,
-                                                   self.scaling_factor)
-                recs.extend(record_dict_list)
+            recs = self._convert_records(self._convert_bfiq_record)
             self._sdarn_dict = recs
             self._sdarn_dmap_records = dict2dmap(recs)
         except Exception as e:
             raise borealis_exceptions.BorealisConvert2IqdatError(e) from e
 
     @staticmethod
-    def __convert_bfiq_record(borealis_slice_id: int,
-                              borealis_bfiq_record: tuple,
-                              origin_string: str,
-                              scaling_factor: int = 1) -> list:
+    def _convert_bfiq_record(borealis_slice_id: int,
+                             borealis_bfiq_record: tuple,
+                             origin_string: str,
+                             scaling_factor: int = 1) -> list:
         """
         Converts a single record dict of Borealis bfiq data to a SDARN DMap
         record dict.
@@ -560,11 +614,27 @@ class BorealisConvert(BorealisRead):
 
         # data_descriptors (dimensions) are num_antenna_arrays,
         # num_sequences, num_beams, num_samps
+        data = np.ascontiguousarray(record_dict['data'], dtype=np.complex64).\
+            reshape(record_dict['data_dimensions'])
         # scale by normalization and then scale to integer max as per
-        # dmap style
-        data = record_dict['data'].reshape(record_dict['data_dimensions']).\
-            astype(np.complex64) / record_dict['data_normalization_factor'] *\
-            np.iinfo(np.int16).max * scaling_factor
+        # dmap style, on the interleaved (real, imag) values, then
+        # limit to the int16 range and convert the whole record at once.
+        # The intermediate values are kept float32, which is plenty for
+        # int16 output; the float64 normalization factor would otherwise
+        # promote them to float64 under NumPy 2 promotion rules.
+        # Dividing a complex64 array by a real scalar multiplies by the
+        # float32 reciprocal of the scalar, so the same is done here to
+        # round identically to the complex division.
+        # Shape is num_antenna_arrays x num_sequences x num_beams x
+        # 2*num_samps
+        scaled_data = data.view(np.float32) * \
+            (np.float32(1) /
+             np.float32(record_dict['data_normalization_factor']))
+        scaled_data *= INT16_MAX
+        scaled_data *= scaling_factor
+        # clipped and truncated to int16 in a single pass
+        int_data = np.empty(scaled_data.shape, dtype=np.int16)
+        np.clip(scaled_data, -32768, 32767, out=int_data, casting='unsafe')
 
         # Borealis git tag version numbers. If not a tagged version,
         # then use 255.255
@@ -580,175 +650,153 @@ class BorealisConvert(BorealisRead):
         offset = 2 * record_dict['antenna_arrays_order'].shape[0] * \
             record_dict['num_samps']
 
-        record_dict_list = []
+        # pulse and lag tables, the same for every beam
+        ptab = record_dict['pulses'].astype(np.int16)
+        ltab = record_dict['lags'].astype(np.int16)
+
+        # integration time split into whole seconds and microseconds
+        int_time = float(record_dict['int_time'])
+        intt_sc = np.int16(int(int_time))
+        intt_us = np.int32((int_time - int(int_time)) * 1e6)
+
+        # sequence timestamps in ms, convert to seconds and us.
+        sqn_timestamps = np.asarray(record_dict['sqn_timestamps'],
+                                    dtype=np.float64)
+        tsc = np.floor(sqn_timestamps / 1e3).astype(np.int32)
+        tus = (np.fmod(sqn_timestamps, 1000.0) * 1e3).astype(np.int32)
+
+        # AGC Status Word only introduced in Borealis v0.6 onwards,
+        # so it can be set to zero if not present
+        if 'agc_status_word' not in record_dict.keys():
+            agc_sw = 0
+        else:
+            agc_sw = record_dict['agc_status_word']
+
+        # Low Power Status Word only introduced in Borealis v0.6 onwards,
+        # so it can be set to zero if not present
+        if 'lp_status_word' not in record_dict.keys():
+            lp_sw = 0
+        else:
+            lp_sw = record_dict['lp_status_word']
+
+        start_time = datetime.utcfromtimestamp(
+            record_dict['sqn_timestamps'][0])
+
+        # The fields are the same for every beam of the record except the
+        # beam number, azimuth and data, which are filled in for each beam.
+        # flattening done in convert_to_dmap_datastructures
+        record_fields = {
+            'radar.revision.major': np.int8(borealis_major_revision),
+            'radar.revision.minor': np.int8(borealis_minor_revision),
+            'origin.code': np.int8(100),  # indicating Borealis
+            'origin.time': start_time.strftime("%c"),
+            'origin.command': 'Borealis ' + \
+                              record_dict['borealis_git_hash'] + \
+                              ' ' + record_dict['experiment_name'],
+            'cp': np.int16(record_dict['experiment_id']),
+            'stid': np.int16(code_to_stid[record_dict['station']]),
+            'time.yr': np.int16(start_time.year),
+            'time.mo': np.int16(start_time.month),
+            'time.dy': np.int16(start_time.day),
+            'time.hr': np.int16(start_time.hour),
+            'time.mt': np.int16(start_time.minute),
+            'time.sc': np.int16(start_time.second),
+            'time.us': np.int32(start_time.microsecond),
+            'txpow': np.int16(-1),
+            'nave': np.int16(record_dict['num_sequences']),
+            'atten': np.int16(0),
+            'lagfr': np.int16(record_dict['first_range_rtt']),
+            # smsep is in us; conversion from seconds
+            'smsep': np.int16(1e6 / record_dict['rx_sample_rate']),
+            'ercod': np.int16(0),
+            'stat.agc': np.int16(agc_sw),
+            'stat.lopwr': np.int16(lp_sw),
+            # TODO: currently not implemented
+            'noise.search': np.float32(record_dict['noise_at_freq'][0]),
+            # TODO: currently not implemented
+            'noise.mean': np.float32(0),
+            'channel': np.int16(borealis_slice_id),
+            'bmnum': None,
+            'bmazm': None,
+            'scan': np.int16(record_dict['scan_start_marker']),
+            # no digital receiver offset or rxrise required in
+            # Borealis
+            'offset': np.int16(0),
+            'rxrise': np.int16(0),
+            'intt.sc': intt_sc,
+            'intt.us': intt_us,
+            'txpl': np.int16(record_dict['tx_pulse_len']),
+            'mpinc': np.int16(record_dict['tau_spacing']),
+            'mppul': np.int16(len(record_dict['pulses'])),
+            # an alternate lag-zero will be given, so subtract 1.
+            'mplgs': np.int16(record_dict['lags'].shape[0] - 1),
+            'nrang': np.int16(record_dict['num_ranges']),
+            'frang': np.int16(round(record_dict['first_range'])),
+            'rsep': np.int16(round(record_dict['range_sep'])),
+            'xcf': np.int16('intf' in record_dict['antenna_arrays_order']),
+            'tfreq': np.int16(record_dict['freq']),
+            # mxpwr filler; cannot specify this information
+            'mxpwr': np.int32(-1),
+            # lvmax RST default
+            'lvmax': np.int32(20000),
+            'iqdata.revision.major': np.int32(1),
+            'iqdata.revision.minor': np.int32(0),
+            'combf': 'Converted from Borealis file: ' + origin_string +\
+                     ' record ' + str(record_key) + \
+                     ' with scaling factor = ' + str(scaling_factor) + \
+                     ' ; Number of beams in record: ' + \
+                     str(len(record_dict['beam_nums'])) + ' ; ' + \
+                     record_dict['experiment_comment'] + ' ; ' + \
+                     record_dict['slice_comment'],
+            'seqnum': np.int32(record_dict['num_sequences']),
+            'chnnum': np.int32(record_dict['antenna_arrays_order'].
+                               shape[0]),
+            'smpnum': np.int32(record_dict['num_samps']),
+            # NOTE: The following is a hack. This is currently how
+            # iqdat files are being processed . RST make_raw does
+            # not use first range information at all, only skip
+            # number.
+            # However ROS provides the number of ranges to the
+            # first range as the skip number. Skip number is
+            # documented as number to identify bad ranges due
+            # to digital receiver rise time. Borealis skpnum should
+            # in theory =0 as the first sample from Borealis
+            # decimated (prebfiq) data is centred on the first
+            # pulse.
+            'skpnum': np.int32(record_dict['first_range'] / \
+                               record_dict['range_sep']),
+            'ptab': ptab,
+            'ltab': ltab,
+            'tsc': tsc,
+            'tus': tus,
+            'tatten': np.zeros(record_dict['num_sequences'], dtype=np.int16),
+            'tnoise': record_dict['noise_at_freq'].astype(np.float32),
+            'toff': np.arange(record_dict['num_sequences'], dtype=np.int32) *
+                    np.int32(offset),
+            'tsze': np.full(record_dict['num_sequences'], offset,
+                            dtype=np.int32),
+            'data': None
+        }
+
+        # one SDARN record per beam
+        record_dict_list = [None] * len(record_dict['beam_nums'])
         for beam_index, beam in enumerate(record_dict['beam_nums']):
             # grab this beam's data
             # shape is now num_antenna_arrays x num_sequences
-            # x num_samps
-            this_data = data[:, :, beam_index, :]
+            # x 2*num_samps
+            this_data = int_data[:, :, beam_index, :]
+
+            sdarn_record_dict = record_fields.copy()
+            sdarn_record_dict['bmnum'] = np.int16(beam)
+            sdarn_record_dict['bmazm'] = \
+                np.float32(record_dict['beam_azms'][beam_index])
             # iqdat shape is num_sequences x num_antennas_arrays x
-            # num_samps x 2 (real, imag), flattened
-            reshaped_data = []
-            for i in range(record_dict['num_sequences']):
-                # get the samples for each array 1 after the other
-                arrays = [this_data[x, i, :]
-                          for x in range(this_data.shape[0])]
-                # append
-                reshaped_data.append(np.ravel(arrays))
-
-            # (num_sequences x num_antenna_arrays x num_samps,
+            # num_samps x 2 (real, imag), flattened, so the samples of
+            # each array follow one another within each sequence
+            # (num_sequences x num_antenna_arrays x num_samps x 2,
             # flattened)
-            flattened_data = np.array(reshaped_data).flatten()
-
-            int_data = np.empty(flattened_data.size * 2, dtype=np.float64)
-            int_data[0::2] = flattened_data.real
-            int_data[1::2] = flattened_data.imag
-
-            np.minimum(int_data, 32767, int_data)
-            np.maximum(int_data, -32768, int_data)
-
-            int_data = np.array(int_data, dtype=np.int16)
-
-            # AGC Status Word only introduced in Borealis v0.6 onwards,
-            # so it can be set to zero if not present
-            if 'agc_status_word' not in record_dict.keys():
-                agc_sw = 0
-            else:
-                agc_sw = record_dict['agc_status_word']
-
-            # Low Power Status Word only introduced in Borealis v0.6 onwards,
-            # so it can be set to zero if not present
-            if 'lp_status_word' not in record_dict.keys():
-                lp_sw = 0
-            else:
-                lp_sw = record_dict['lp_status_word']
-
-            # flattening done in convert_to_dmap_datastructures
-            sdarn_record_dict = {
-                'radar.revision.major': np.int8(borealis_major_revision),
-                'radar.revision.minor': np.int8(borealis_minor_revision),
-                'origin.code': np.int8(100),  # indicating Borealis
-                'origin.time':
-                    datetime.\
-                    utcfromtimestamp(record_dict['sqn_timestamps'][0]).\
-                    strftime("%c"),
-                'origin.command': 'Borealis ' + \
-                                  record_dict['borealis_git_hash'] + \
-                                  ' ' + record_dict['experiment_name'],
-                'cp': np.int16(record_dict['experiment_id']),
-                'stid': np.int16(code_to_stid[record_dict['station']]),
-                'time.yr': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    year),
-                'time.mo': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    month),
-                'time.dy': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    day),
-                'time.hr': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    hour),
-                'time.mt': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    minute),
-                'time.sc': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    second),
-                'time.us': np.int32(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    microsecond),
-                'txpow': np.int16(-1),
-                'nave': np.int16(record_dict['num_sequences']),
-                'atten': np.int16(0),
-                'lagfr': np.int16(record_dict['first_range_rtt']),
-                # smsep is in us; conversion from seconds
-                'smsep': np.int16(1e6 / record_dict['rx_sample_rate']),
-                'ercod': np.int16(0),
-                'stat.agc': np.int16(agc_sw),
-                'stat.lopwr': np.int16(lp_sw),
-                # TODO: currently not implemented
-                'noise.search': np.float32(record_dict['noise_at_freq'][0]),
-                # TODO: currently not implemented
-                'noise.mean': np.float32(0),
-                'channel': np.int16(borealis_slice_id),
-                'bmnum': np.int16(beam),
-                'bmazm': np.float32(record_dict['beam_azms'][beam_index]),
-                'scan': np.int16(record_dict['scan_start_marker']),
-                # no digital receiver offset or rxrise required in
-                # Borealis
-                'offset': np.int16(0),
-                'rxrise': np.int16(0),
-                'intt.sc': np.int16(np.floor(record_dict['int_time'])),
-                'intt.us': np.int32(np.fmod(record_dict['int_time'], 1.0) * \
-                                    1e6),
-                'txpl': np.int16(record_dict['tx_pulse_len']),
-                'mpinc': np.int16(record_dict['tau_spacing']),
-                'mppul': np.int16(len(record_dict['pulses'])),
-                # an alternate lag-zero will be given, so subtract 1.
-                'mplgs': np.int16(record_dict['lags'].shape[0] - 1),
-                'nrang': np.int16(record_dict['num_ranges']),
-                'frang': np.int16(round(record_dict['first_range'])),
-                'rsep': np.int16(round(record_dict['range_sep'])),
-                'xcf': np.int16('intf' in record_dict['antenna_arrays_order']),
-                'tfreq': np.int16(record_dict['freq']),
-                # mxpwr filler; cannot specify this information
-                'mxpwr': np.int32(-1),
-                # lvmax RST default
-                'lvmax': np.int32(20000),
-                'iqdata.revision.major': np.int32(1),
-                'iqdata.revision.minor': np.int32(0),
-                'combf': 'Converted from Borealis file: ' + origin_string +\
-                         ' record ' + str(record_key) + \
-                         ' with scaling factor = ' + str(scaling_factor) + \
-                         ' ; Number of beams in record: ' + \
-                         str(len(record_dict['beam_nums'])) + ' ; ' + \
-                         record_dict['experiment_comment'] + ' ; ' + \
-                         record_dict['slice_comment'],
-                'seqnum': np.int32(record_dict['num_sequences']),
-                'chnnum': np.int32(record_dict['antenna_arrays_order'].
-                                   shape[0]),
-                'smpnum': np.int32(record_dict['num_samps']),
-                # NOTE: The following is a hack. This is currently how
-                # iqdat files are being processed . RST make_raw does
-                # not use first range information at all, only skip
-                # number.
-                # However ROS provides the number of ranges to the
-                # first range as the skip number. Skip number is
-                # documented as number to identify bad ranges due
-                # to digital receiver rise time. Borealis skpnum should
-                # in theory =0 as the first sample from Borealis
-                # decimated (prebfiq) data is centred on the first
-                # pulse.
-                'skpnum': np.int32(record_dict['first_range'] / \
-                                   record_dict['range_sep']),
-                'ptab': record_dict['pulses'].astype(np.int16),
-                'ltab': record_dict['lags'].astype(np.int16),
-                # timestamps in ms, convert to seconds and us.
-                'tsc': np.array([np.floor(x/1e3) for x in
-                                 record_dict['sqn_timestamps']],
-                                dtype=np.int32),
-                'tus': np.array([np.fmod(x, 1000.0) * 1e3 for x in
-                                 record_dict['sqn_timestamps']],
-                                dtype=np.int32),
-                'tatten': np.array([0] * record_dict['num_sequences'],
-                                   dtype=np.int16),
-                'tnoise': record_dict['noise_at_freq'].astype(np.float32),
-                'toff': np.array([i * offset for i in
-                                  range(record_dict['num_sequences'])],
-                                 dtype=np.int32),
-                'tsze': np.array([offset] * record_dict['num_sequences'],
-                                 dtype=np.int32),
-                'data': int_data
-            }
-            record_dict_list.append(sdarn_record_dict)
+            sdarn_record_dict['data'] = np.ravel(this_data.transpose(1, 0, 2))
+            record_dict_list[beam_index] = sdarn_record_dict
         return record_dict_list
 
     def _convert_rawacf_to_rawacf(self):
@@ -757,7 +805,7 @@ class BorealisConvert(BorealisRead):
 
         See Also
         --------
-        __convert_rawacf_record
+        _convert_rawacf_record
         https://superdarn.github.io/rst/superdarn/src.doc/rfc/0008.html
         https://borealis.readthedocs.io/en/master/
         BorealisRawacf
@@ -772,24 +820,17 @@ class BorealisConvert(BorealisRead):
         dmap_recs, the records converted to DMap format
         """
         try:
-            recs = []
-            for record in self.borealis_records.items():
-                record_dict_list = \
-                        self.__convert_rawacf_record(self.borealis_slice_id,
-                                                     record,
-                                                     self.borealis_filename,
-                                                     self.scaling_factor)
-                recs.extend(record_dict_list)
+            recs = self._convert_records(self._convert_rawacf_record)
             self._sdarn_dict = recs
             self._sdarn_dmap_records = dict2dmap(recs)
         except Exception as e:
             raise borealis_exceptions.BorealisConvert2RawacfError(e) from e
 
     @staticmethod
-    def __convert_rawacf_record(borealis_slice_id: int,
-                                borealis_rawacf_record: tuple,
-                                origin_string: str,
-                                scaling_factor: int = 1) -> list:
+    def _convert_rawacf_record(borealis_slice_id: int,
+                               borealis_rawacf_record: tuple,
+                               origin_string: str,
+                               scaling_factor: int = 1) -> list:
         """
         Converts a single record dict of Borealis rawacf data to a SDARN DMap
         record dict.
@@ -816,30 +857,19 @@ class BorealisConvert(BorealisRead):
         # key value pair from Borealis record dictionary
         (record_key, record_dict) = borealis_rawacf_record
 
-        shaped_data = {}
         data_dimensions = record_dict.get('correlation_dimensions', None)     # Until Borealis v0.7
         if data_dimensions is None:
             data_dimensions = record_dict.get('data_dimensions')        # Borealis v0.7 onwards
 
         # correlation_descriptors are num_beams, num_ranges, num_lags
         # scale by the scale squared to make up for the multiply
-        # in correlation (integer max squared)
-        shaped_data['main_acfs'] = record_dict['main_acfs'].reshape(
-            data_dimensions).astype(
-            np.complex64) *\
-            ((np.iinfo(np.int16).max**2 * scaling_factor) /
-             (record_dict['data_normalization_factor']**2))
-
-        if 'intf_acfs' in record_dict.keys():
-            shaped_data['intf_acfs'] = record_dict['intf_acfs'].reshape(
-                data_dimensions).astype(np.complex64) *\
-                ((np.iinfo(np.int16).max**2 * scaling_factor) /
-                 (record_dict['data_normalization_factor']**2))
-        if 'xcfs' in record_dict.keys():
-            shaped_data['xcfs'] = record_dict['xcfs'].reshape(
-                data_dimensions).astype(np.complex64) *\
-                ((np.iinfo(np.int16).max**2 * scaling_factor) /
-                 (record_dict['data_normalization_factor']**2))
+        # in correlation (integer max squared). The scale is real and the
+        # same for every correlation.
+        scale = np.float32((INT16_MAX_SQ * scaling_factor) /
+                           (record_dict['data_normalization_factor']**2))
+
+        # the cross correlations are optional
+        has_xcf = 'xcfs' in record_dict
 
         # Borealis git tag version numbers. If not a tagged version,
         # then use 255.255
@@ -851,171 +881,182 @@ class BorealisConvert(BorealisRead):
             borealis_major_revision = 255
             borealis_minor_revision = 255
 
-        record_dict_list = []
-        for beam_index, beam in enumerate(record_dict['beam_nums']):
-            # this beam, all ranges lag 0
-            lag_zero = shaped_data['main_acfs'][beam_index, :, 0]
-
-            # Historically, the following line was un-commented. It's purpose was to replace the lag0 data for far
-            # ranges which were contaminated by the second pulse in a sequence. However, it only worked for a small
-            # subset of conditions; specifically, it failed for experiments where the second pulse occurred earlier
-            # or the number of range gates was larger than normal. This replacement is now handled in borealis, and
-            # is more flexible to deal with the variety of different conditions possible from experiments.
-            # lag_zero[-10:] = shaped_data['main_acfs'][beam_index, -10:, -1]
-
-            lag_zero_power = (lag_zero.real**2 + lag_zero.imag**2)**0.5
-
-            correlation_dict = {}
-            for key in shaped_data:
-                # num_ranges x num_lags (complex)
-                this_correlation = shaped_data[key][beam_index, :, :-1]
-
-                ##### Similar to above, this line has been commented out to avoid far-range lag0 replacement
-                ##### as it is now handled in borealis.
-                # this_correlation[-10:, 0] = \
-                #     shaped_data[key][beam_index, -10:, -1]
-
-                # (num_ranges x num_lags, flattened)
-                flattened_data = np.array(this_correlation).flatten()
-
-                int_data = np.empty(flattened_data.size * 2, dtype=np.float32)
-                int_data[0::2] = flattened_data.real
-                int_data[1::2] = flattened_data.imag
-                # num_ranges x num_lags x 2; num_lags is one less than
-                # in Borealis file because Borealis keeps alternate
-                # lag0
-                new_data = int_data.reshape(
-                    data_dimensions[1],
-                    data_dimensions[2]-1,
-                    2)
-                # NOTE: Flattening happening in
-                # convert_to_dmap_datastructures
-                # place the SDARN-style array in the dict
-                correlation_dict[key] = new_data
-
-            # AGC Status Word only introduced in Borealis v0.6 onwards,
-            # so it can be set to zero if not present
-            if 'agc_status_word' not in record_dict.keys():
-                agc_sw = 0
-            else:
-                agc_sw = record_dict['agc_status_word']
-
-            # Low Power Status Word only introduced in Borealis v0.6 onwards,
-            # so it can be set to zero if not present
-            if 'lp_status_word' not in record_dict.keys():
-                lp_sw = 0
-            else:
-                lp_sw = record_dict['lp_status_word']
+        # all beams, all ranges lag 0, as scaled float32 (real, imag) pairs
+        lag_zero = np.asarray(record_dict['main_acfs'], dtype=np.complex64).\
+            reshape(data_dimensions)[:, :, :1].view(np.float32) * scale
+
+        # Historically, the following line was un-commented. It's purpose was to replace the lag0 data for far
+        # ranges which were contaminated by the second pulse in a sequence. However, it only worked for a small
+        # subset of conditions; specifically, it failed for experiments where the second pulse occurred earlier
+        # or the number of range gates was larger than normal. This replacement is now handled in borealis, and
+        # is more flexible to deal with the variety of different conditions possible from experiments.
+        # lag_zero[:, -10:] = np.asarray(record_dict['main_acfs'],
+        #     dtype=np.complex64).reshape(data_dimensions)[:, -10:, -1:].\
+        #     view(np.float32) * scale
+
+        # magnitude of the lag zero, float32; num_beams x num_ranges
+        lag_zero_power = np.hypot(lag_zero[..., 0], lag_zero[..., 1])
+
+        # The correlations are packed for every beam at once into one
+        # output array per correlation, so the per-beam records below only
+        # take views. num_beams x num_ranges x num_lags x 2; num_lags is one
+        # less than in Borealis file because Borealis keeps alternate lag0.
+        # Only the correlations SDARN rawacf has fields for are packed (acfd
+        # and xcfd); the interferometer acfs are not written.
+        packed_shape = (data_dimensions[0], data_dimensions[1],
+                        data_dimensions[2] - 1, 2)
+        correlation_keys = ['main_acfs']
+        if has_xcf:
+            correlation_keys.append('xcfs')
+        packed_data = {}
+        for key in correlation_keys:
+            # num_beams x num_ranges x num_lags (complex)
+            this_correlation = np.asarray(
+                record_dict[key], dtype=np.complex64).reshape(
+                data_dimensions)[:, :, :-1]
+
+            ##### Similar to above, this line has been commented out to avoid far-range lag0 replacement
+            ##### as it is now handled in borealis.
+            # this_correlation[:, -10:, 0] = record_dict[key].reshape(
+            #     data_dimensions)[:, -10:, -1]
+
+            # complex64 is stored as interleaved float32 (real, imag)
+            # pairs, which is already the SDARN layout. As the scale is
+            # real, both parts are scaled alike as float32 values, straight
+            # into the packed array, rather than by a complex multiply.
+            packed = np.empty(packed_shape, dtype=np.float32)
+            np.multiply(this_correlation.view(np.float32), scale,
+                        out=packed.reshape(data_dimensions[0],
+                                           data_dimensions[1], -1))
+            packed_data[key] = packed
+
+        # list from 0 to num_ranges, the same for every beam
+        slist = np.arange(data_dimensions[1], dtype=np.int16)
+
+        # pulse and lag tables, the same for every beam
+        ptab = record_dict['pulses'].astype(np.int16)
+        ltab = record_dict['lags'].astype(np.int16)
+
+        # integration time split into whole seconds and microseconds
+        int_time = float(record_dict['int_time'])
+        intt_sc = np.int16(int(int_time))
+        intt_us = np.int32((int_time - int(int_time)) * 1e6)
+
+        # TX Antenna Mag only introduced in Borealis v0.7 onwards, so txpow defaults to -1 if not present.
+        # If present, txpow is a bitfield mapping of whether each antenna was transmitting. Antenna 15 is the
+        # MSB, and Antenna 0 the LSB. Since txpow is a signed int in DMAP, -1 means all antennas transmitting.
+        # The bitfield is the same for every beam of the record.
+        if 'tx_antenna_phases' not in record_dict.keys():
+            txpow = -1      # This is the same as if all antennas were transmitting.
+        else:
+            active = (np.abs(record_dict['tx_antenna_phases']) > 0).\
+                astype(np.uint16)
+            txpow = np.bitwise_or.reduce(
+                active << np.arange(active.size, dtype=np.uint16))
+
+        # AGC Status Word only introduced in Borealis v0.6 onwards,
+        # so it can be set to zero if not present
+        if 'agc_status_word' not in record_dict.keys():
+            agc_sw = 0
+        else:
+            agc_sw = record_dict['agc_status_word']
 
-            # TX Antenna Mag only introduced in Borealis v0.7 onwards, so txpow defaults to -1 if not present.
-            # If present, txpow is a bitfield mapping of whether each antenna was transmitting. Antenna 15 is the
-            # MSB, and Antenna 0 the LSB. Since txpow is a signed int in DMAP, -1 means all antennas transmitting.
-            if 'tx_antenna_phases' not in record_dict.keys():
-                txpow = -1      # This is the same as if all antennas were transmitting.
-            else:
-                txpow = np.uint16()
-                for i in range(len(record_dict['tx_antenna_phases'])):
-                    if np.abs(record_dict['tx_antenna_phases'][i]) > 0:
-                        txpow += 1 << i
-
-            sdarn_record_dict = {
-                'radar.revision.major': np.int8(borealis_major_revision),
-                'radar.revision.minor': np.int8(borealis_minor_revision),
-                'origin.code': np.int8(100),  # indicating Borealis
-                'origin.time':
-                    datetime.\
-                    utcfromtimestamp(record_dict['sqn_timestamps'][0]).\
-                    strftime("%c"),
-                'origin.command': 'Borealis ' +\
-                                  record_dict['borealis_git_hash'] +\
-                                  ' ' + record_dict['experiment_name'],
-                'cp': np.int16(record_dict['experiment_id']),
-                'stid': np.int16(code_to_stid[record_dict['station']]),
-                'time.yr': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    year),
-                'time.mo': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    month),
-                'time.dy': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    day),
-                'time.hr': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    hour),
-                'time.mt': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    minute),
-                'time.sc': np.int16(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    second),
-                'time.us': np.int32(datetime.
-                                    utcfromtimestamp(
-                                        record_dict['sqn_timestamps'][0]).
-                                    microsecond),
-                'txpow': np.int16(txpow),
-                # see Borealis documentation
-                'nave': np.int16(record_dict['num_sequences']),
-                'atten': np.int16(0),
-                'lagfr': np.int16(record_dict['first_range_rtt']),
-                'smsep': np.int16(1e6/record_dict['rx_sample_rate']),
-                'ercod': np.int16(0),
-                'stat.agc': np.int16(agc_sw),
-                'stat.lopwr': np.int16(lp_sw),
-                # TODO: currently not implemented
-                'noise.search': np.float32(record_dict['noise_at_freq'][0]),
-                # TODO: currently not implemented
-                'noise.mean': np.float32(0),
-                'channel': np.int16(borealis_slice_id),
-                'bmnum': np.int16(beam),
-                'bmazm': np.float32(record_dict['beam_azms'][beam_index]),
-                'scan': np.int16(record_dict['scan_start_marker']),
-                # no digital receiver offset or rxrise required in
-                # Borealis
-                'offset': np.int16(0),
-                'rxrise': np.int16(0),
-                'intt.sc': np.int16(np.floor(record_dict['int_time'])),
-                'intt.us': np.int32(np.fmod(record_dict['int_time'], 1.0) * \
-                                    1e6),
-                'txpl': np.int16(record_dict['tx_pulse_len']),
-                'mpinc': np.int16(record_dict['tau_spacing']),
-                'mppul': np.int16(len(record_dict['pulses'])),
-                # an alternate lag-zero will be given.
-                'mplgs': np.int16(record_dict['lags'].shape[0] - 1),
-                'nrang': np.int16(data_dimensions[1]),
-                'frang': np.int16(round(record_dict['first_range'])),
-                'rsep': np.int16(round(record_dict['range_sep'])),
-                # False if list is empty.
-                'xcf': np.int16(bool('xcfs' in record_dict.keys())),
-                'tfreq': np.int16(record_dict['freq']),
-                'mxpwr': np.int32(-1),
-                'lvmax': np.int32(20000),
-                'rawacf.revision.major': np.int32(1),
-                'rawacf.revision.minor': np.int32(0),
-                'combf': 'Converted from Borealis file: ' + origin_string + \
-                         ' record ' + str(record_key) + \
-                         ' with scaling factor = ' + str(scaling_factor) + \
-                         ' ; Number of beams in record: ' + \
-                         str(len(record_dict['beam_nums'])) + ' ; ' + \
-                         record_dict['experiment_comment'] + ' ; ' + \
-                         record_dict['slice_comment'],
-                'thr': np.float32(0),
-                'ptab': record_dict['pulses'].astype(np.int16),
-                'ltab': record_dict['lags'].astype(np.int16),
-                'pwr0': lag_zero_power.astype(np.float32),
-                # list from 0 to num_ranges
-                'slist': np.array(list(
-                            range(0, data_dimensions[1]))
-                            ).astype(np.int16),
-                'acfd': correlation_dict['main_acfs'],
-                'xcfd': correlation_dict['xcfs']
-            }
-            record_dict_list.append(sdarn_record_dict)
+        # Low Power Status Word only introduced in Borealis v0.6 onwards,
+        # so it can be set to zero if not present
+        if 'lp_status_word' not in record_dict.keys():
+            lp_sw = 0
+        else:
+            lp_sw = record_dict['lp_status_word']
+
+        start_time = datetime.utcfromtimestamp(
+            record_dict['sqn_timestamps'][0])
+
+        # The fields are the same for every beam of the record except the
+        # beam number, azimuth and data, which are filled in for each beam.
+        # NOTE: Flattening happening in
+        # convert_to_dmap_datastructures
+        record_fields = {
+            'radar.revision.major': np.int8(borealis_major_revision),
+            'radar.revision.minor': np.int8(borealis_minor_revision),
+            'origin.code': np.int8(100),  # indicating Borealis
+            'origin.time': start_time.strftime("%c"),
+            'origin.command': 'Borealis ' +\
+                              record_dict['borealis_git_hash'] +\
+                              ' ' + record_dict['experiment_name'],
+            'cp': np.int16(record_dict['experiment_id']),
+            'stid': np.int16(code_to_stid[record_dict['station']]),
+            'time.yr': np.int16(start_time.year),
+            'time.mo': np.int16(start_time.month),
+            'time.dy': np.int16(start_time.day),
+            'time.hr': np.int16(start_time.hour),
+            'time.mt': np.int16(start_time.minute),
+            'time.sc': np.int16(start_time.second),
+            'time.us': np.int32(start_time.microsecond),
+            'txpow': np.int16(txpow),
+            # see Borealis documentation
+            'nave': np.int16(record_dict['num_sequences']),
+            'atten': np.int16(0),
+            'lagfr': np.int16(record_dict['first_range_rtt']),
+            'smsep': np.int16(1e6/record_dict['rx_sample_rate']),
+            'ercod': np.int16(0),
+            'stat.agc': np.int16(agc_sw),
+            'stat.lopwr': np.int16(lp_sw),
+            # TODO: currently not implemented
+            'noise.search': np.float32(record_dict['noise_at_freq'][0]),
+            # TODO: currently not implemented
+            'noise.mean': np.float32(0),
+            'channel': np.int16(borealis_slice_id),
+            'bmnum': None,
+            'bmazm': None,
+            'scan': np.int16(record_dict['scan_start_marker']),
+            # no digital receiver offset or rxrise required in
+            # Borealis
+            'offset': np.int16(0),
+            'rxrise': np.int16(0),
+            'intt.sc': intt_sc,
+            'intt.us': intt_us,
+            'txpl': np.int16(record_dict['tx_pulse_len']),
+            'mpinc': np.int16(record_dict['tau_spacing']),
+            'mppul': np.int16(len(record_dict['pulses'])),
+            # an alternate lag-zero will be given.
+            'mplgs': np.int16(record_dict['lags'].shape[0] - 1),
+            'nrang': np.int16(data_dimensions[1]),
+            'frang': np.int16(round(record_dict['first_range'])),
+            'rsep': np.int16(round(record_dict['range_sep'])),
+            # False if list is empty.
+            'xcf': np.int16(has_xcf),
+            'tfreq': np.int16(record_dict['freq']),
+            'mxpwr': np.int32(-1),
+            'lvmax': np.int32(20000),
+            'rawacf.revision.major': np.int32(1),
+            'rawacf.revision.minor': np.int32(0),
+            'combf': 'Converted from Borealis file: ' + origin_string + \
+                     ' record ' + str(record_key) + \
+                     ' with scaling factor = ' + str(scaling_factor) + \
+                     ' ; Number of beams in record: ' + \
+                     str(len(record_dict['beam_nums'])) + ' ; ' + \
+                     record_dict['experiment_comment'] + ' ; ' + \
+                     record_dict['slice_comment'],
+            'thr': np.float32(0),
+            'ptab': ptab,
+            'ltab': ltab,
+            'pwr0': None,
+            'slist': slist,
+            'acfd': None,
+            'xcfd': None
+        }
+
+        # one SDARN record per beam
+        record_dict_list = [None] * len(record_dict['beam_nums'])
+        for beam_index, beam in enumerate(record_dict['beam_nums']):
+            sdarn_record_dict = record_fields.copy()
+            sdarn_record_dict['bmnum'] = np.int16(beam)
+            sdarn_record_dict['bmazm'] = \
+                np.float32(record_dict['beam_azms'][beam_index])
+            sdarn_record_dict['pwr0'] = lag_zero_power[beam_index]
+            # place the SDARN-style arrays for this beam in the dict
+            sdarn_record_dict['acfd'] = packed_data['main_acfs'][beam_index]
+            sdarn_record_dict['xcfd'] = packed_data['xcfs'][beam_index]
+            record_dict_list[beam_index] = sdarn_record_dict
 
         return record_dict_list
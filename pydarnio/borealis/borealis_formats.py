@@ -694,7 +694,7 @@ class BorealisRawacfv0_4(BaseFormat):
 
         # dimensions provided in correlation_dimensions field as num_beams,
         # num_ranges, num_lags for the rawacf format.
-        new_records = copy.deepcopy(records)
+        new_records = BaseFormat.reshape_site_arrays(records)
         for key in list(records.keys()):
             record_dimensions = new_records[key]['correlation_dimensions']
             for field in ['main_acfs', 'intf_acfs', 'xcfs']:
@@ -1018,7 +1018,7 @@ class BorealisBfiqv0_4(BaseFormat):
         site structured files, so this field is reshaped here to the
         correct dimensions given in data_dimensions.
         """
-        new_records = copy.deepcopy(records)
+        new_records = BaseFormat.reshape_site_arrays(records)
         for key in list(records.keys()):
             record_dimensions = records[key]['data_dimensions']
             for field in ['data']:
@@ -1325,7 +1325,7 @@ class BorealisAntennasIqv0_4(BaseFormat):
         site structured files, so this field is reshaped here to the correct
         data_dimensions given in the file.
         """
-        new_records = copy.deepcopy(records)
+        new_records = BaseFormat.reshape_site_arrays(records)
         for key in list(records.keys()):
             record_dimensions = records[key]['data_dimensions']
             for field in ['data']:
@@ -1572,7 +1572,7 @@ class BorealisRawrfv0_4(BaseFormat):
         BorealisRawrf has the data field flattened in the
         site structured files, so this field is reshaped in here.
         """
-        new_records = copy.deepcopy(records)
+        new_records = BaseFormat.reshape_site_arrays(records)
         for key in list(records.keys()):
             record_dimensions = records[key]['data_dimensions']
             for field in ['data']:
@@ -2333,7 +2333,7 @@ class BorealisRawacf(BorealisRawacfv0_6):
         """
         # dimensions provided in data_dimensions field as num_beams,
         # num_ranges, num_lags for the rawacf format.
-        new_records = copy.deepcopy(records)
+        new_records = BaseFormat.reshape_site_arrays(records)
         return new_records
 
     @staticmethod
@@ -34,7 +34,6 @@ see: https://borealis.readthedocs.io/en/master/
 import h5py
 import logging
 import numpy as np
-from datetime import datetime
 from typing import Union
 from collections import OrderedDict
 
@@ -202,6 +201,15 @@ class BorealisRestructure(object):
         """
         attribute_types = self.format.site_single_element_types()
         dataset_types = self.format.array_dtypes()
+
+        # The field definitions are built on every call, so they are looked
+        # up once rather than for every field of every record
+        single_element_types = self.format.single_element_types()
+        unshared_fields = self.format.unshared_fields()
+        unshared_fields_dims = self.format.unshared_fields_dims_site()
+        site_specific_fields = self.format.site_specific_fields()
+        site_specific_fields_generate = \
+            self.format.site_specific_fields_generate()
         try:
             with h5py.File(self.infile_name, 'r') as f:
 
@@ -223,8 +231,8 @@ class BorealisRestructure(object):
                 # These are fields which have one element per record, so the
                 # arrays are small enough to be loaded completely into memory
                 unshared_single_elements = dict()
-                for field in self.format.unshared_fields():
-                    if field in self.format.single_element_types():
+                for field in unshared_fields:
+                    if field in single_element_types:
                         if field in self.format.single_string_fields():
                             dset = f[field]
                             itemsize = dset.attrs['itemsize']
@@ -232,14 +240,12 @@ class BorealisRestructure(object):
                         else:
                             unshared_single_elements[field] = f[field][:]
 
-                sqn_timestamps_array = f['sqn_timestamps'][:]
+                # format dictionary keys in the same way it is done
+                # in datawrite on site
+                record_keys = self.format.site_record_keys(
+                    f['sqn_timestamps'][:, 0])
 
-                for record_num, seq_timestamp in enumerate(sqn_timestamps_array):
-                    # format dictionary key in the same way it is done
-                    # in datawrite on site
-                    seq_datetime = datetime.utcfromtimestamp(seq_timestamp[0])
-                    epoch = datetime.utcfromtimestamp(0)
-                    key = str(int((seq_datetime - epoch).total_seconds() * 1000))
+                for record_num, key in enumerate(record_keys):
 
                     # Make this fresh every time, to reduce memory footprint
                     record_dict = dict()
@@ -250,14 +256,13 @@ class BorealisRestructure(object):
 
                     # populate site specific fields using given functions
                     # that take both the arrays data and the record number
-                    for field in self.format.site_specific_fields():
+                    for field in site_specific_fields:
                         record_dict[field] = \
-                            self.format.site_specific_fields_generate(
-                                )[field](f, record_num)
+                            site_specific_fields_generate[field](f, record_num)
 
-                    for field in self.format.unshared_fields():
-                        if field in self.format.single_element_types():
-                            datatype = self.format.single_element_types()[field]
+                    for field in unshared_fields:
+                        if field in single_element_types:
+                            datatype = single_element_types[field]
                             # field is not an array, single element per record.
                             # unshared_field_dims_site should give empty list.
                             record_dict[field] = \
@@ -267,8 +272,7 @@ class BorealisRestructure(object):
                             # need to get the dims correct, not always equal to the max
                             site_dims = [dimension_function(f, record_num)
                                          for dimension_function in
-                                         self.format.unshared_fields_dims_site(
-                                                )[field]]
+                                         unshared_fields_dims[field]]
                             dims = []
                             for dim in site_dims:
                                 if isinstance(dim, list):
@@ -323,20 +327,25 @@ class BorealisRestructure(object):
             # Functions that get called on each record, storing them here for readability
             array_specific_fields_funcs = self.format.array_specific_fields_iterative_generator()
 
+            # The field definitions are built on every call, so they are
+            # looked up once rather than for every record (and every
+            # attribute of every record)
+            bool_types = self.format.bool_types()
+            skipped_attrs = frozenset(['CLASS', 'TITLE', 'VERSION'] + bool_types)
+            unshared_fields = self.format.unshared_fields()
+
             with h5py.File(self.infile_name, 'r') as f:
                 for rec_idx, record_name in enumerate(self.record_names):
 
                     record = f[record_name]     # returns a view, doesn't do full loading into memory
-                    rec_keys = list(record.keys())
-                    rec_dict = {k: record[k][()] for k in rec_keys}
+                    rec_dict = {k: record[k][()] for k in record}
 
                     # Some things are stored as attributes, must be loaded in separately
-                    rec_attrs = [k for k in record.attrs.keys() if k not in
-                                 ['CLASS', 'TITLE', 'VERSION'] + self.format.bool_types()]
+                    rec_attrs = [k for k in record.attrs if k not in skipped_attrs]
                     rec_dict.update({k: record.attrs[k] for k in rec_attrs})
                     # Bitwise fields also need to be handled separately
-                    for field in self.format.bool_types():
-                        rec_dict[field] = f[record_name].attrs[field]
+                    for field in bool_types:
+                        rec_dict[field] = record.attrs[field]
 
                     # some fields are linear in site style and need to be reshaped.
                     # Pass in record nested in a dictionary, as
@@ -422,7 +431,7 @@ class BorealisRestructure(object):
                         first_time = False
 
                     # Fill the unshared and array-only fields for this record
-                    for field in self.format.unshared_fields():
+                    for field in unshared_fields:
                         empty_array = new_data_dict[field]
                         if type(data_dict[field]) == np.ndarray:
                             # only fill the correct length, appended NaNs occur
@@ -440,7 +449,6 @@ class BorealisRestructure(object):
 
             attribute_types = self.format.array_single_element_types()
             dataset_types = self.format.array_array_dtypes()
-            unshared_fields = self.format.unshared_fields()
             BorealisUtilities.check_arrays(self.infile_name, new_data_dict, attribute_types, dataset_types,
                                            unshared_fields)
             self.format.write_arrays(self.outfile_name, new_data_dict, self.compression)
@@ -115,25 +115,24 @@ class BorealisSiteRead():
                 self.filename, borealis_filetype)
         self.borealis_filetype = borealis_filetype
 
+        # the record names and version are both read in one open of the file
         with h5py.File(self.filename, 'r') as f:
             self._record_names = sorted(list(f.keys()))
             # list of group names in the HDF5 file, to allow partial read.
 
-        # get the version of the file - split by the dash, first part should be
-        # 'vX.X'
-
-        try:
-            with h5py.File(self.filename, 'r') as f:
+            # get the version of the file - split by the dash, first part
+            # should be 'vX.X'
+            try:
                 first_rec = f[self._record_names[0]]
                 full_version = first_rec.attrs['borealis_git_hash'].decode('utf-8').split('-')[0]
                 version = '.'.join(full_version.split('.')[:2])      # vX.Y, ignore patch revision
-        except (IndexError, KeyError) as err:
-            # if this is an array style file, it will raise
-            # IndexError on the array.
-            raise borealis_exceptions.BorealisStructureError(
-                ' {} Could not find the borealis_git_hash required to '
-                'determine read version (file may be array style): {}'
-                ''.format(self.filename, err)) from err
+            except (IndexError, KeyError) as err:
+                # if this is an array style file, it will raise
+                # IndexError on the array.
+                raise borealis_exceptions.BorealisStructureError(
+                    ' {} Could not find the borealis_git_hash required to '
+                    'determine read version (file may be array style): {}'
+                    ''.format(self.filename, err)) from err
 
         if version not in borealis_formats.borealis_version_dict:
             raise borealis_exceptions.BorealisVersionError(self.filename,
@@ -12,14 +12,16 @@ And supports conversion of the following Borealis types:
     site -> array
     array -> site
 """
-import gc
 import logging
 import numpy as np
 import os
+import shutil
+import tempfile
 import unittest
 import pydarnio
 
-from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
 
 pydarnio_logger = logging.getLogger('pydarnio')
 
@@ -48,66 +50,109 @@ borealis_array_num_records_error_file = ""
 borealis_empty_file = "../test_files/empty.rawacf"
 
 
+@lru_cache(maxsize=None)
+def read_source_file(filename, filetype, file_structure):
+    """
+    Reads a source test file once per session, so every test that uses
+    the file shares the same BorealisRead instead of parsing it again.
+    The source files are only ever read by these tests.
+
+    Only the file's own structure is stored on the reader; the other one
+    (arrays of a site file, records of an array file) is restructured on
+    every access, so tests take it once and keep the result.
+    """
+    return pydarnio.BorealisRead(filename, filetype, file_structure)
+
+
 class IntegrationBorealisRestructure(unittest.TestCase):
     """
     Testing class for integrations of BorealisRestructure
     """
 
+    @classmethod
+    def setUpClass(cls):
+        cls.source_rawacf_site_file = borealis_site_rawacf_file
+        cls.source_rawacf_array_file = borealis_array_rawacf_file
+        cls.source_bfiq_site_file = borealis_site_bfiq_file
+        cls.source_bfiq_array_file = borealis_array_bfiq_file
+        cls.source_antennas_iq_site_file = borealis_site_antennas_iq_file
+        cls.source_antennas_iq_array_file = borealis_array_antennas_iq_file
+
     def setUp(self):
-        self.source_rawacf_site_file = borealis_site_rawacf_file
-        self.write_rawacf_site_file = 'test_rawacf.rawacf.hdf5.site'
-        self.source_rawacf_array_file = borealis_array_rawacf_file
-        self.write_rawacf_array_file = 'test_rawacf.rawacf.hdf5'
-
-        self.source_bfiq_site_file = borealis_site_bfiq_file
-        self.write_bfiq_site_file = 'test_bfiq.bfiq.hdf5.site'
-        self.source_bfiq_array_file = borealis_array_bfiq_file
-        self.write_bfiq_array_file = 'test_bfiq.bfiq.hdf5.array'
-
-        self.source_antennas_iq_site_file = borealis_site_antennas_iq_file
-        self.write_antennas_iq_site_file =\
-            'test_antennas_iq.antennas_iq.hdf5.site'
-        self.source_antennas_iq_array_file = borealis_array_antennas_iq_file
-        self.write_antennas_iq_array_file =\
-            'test_antennas_iq.antennas_iq.hdf5.array'
+        # Written files go to a temporary directory removed in tearDown,
+        # so a failed test does not leave files behind for the next one
+        self.tmpdir = tempfile.mkdtemp()
+
+        self.write_rawacf_site_file = os.path.join(
+            self.tmpdir, 'test_rawacf.rawacf.hdf5.site')
+        self.write_rawacf_array_file = os.path.join(
+            self.tmpdir, 'test_rawacf.rawacf.hdf5')
+        self.write_bfiq_site_file = os.path.join(
+            self.tmpdir, 'test_bfiq.bfiq.hdf5.site')
+        self.write_bfiq_array_file = os.path.join(
+            self.tmpdir, 'test_bfiq.bfiq.hdf5.array')
+        self.write_antennas_iq_site_file = os.path.join(
+            self.tmpdir, 'test_antennas_iq.antennas_iq.hdf5.site')
+        self.write_antennas_iq_array_file = os.path.join(
+            self.tmpdir, 'test_antennas_iq.antennas_iq.hdf5.array')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     # RESTRUCTURING TESTS
     def check_dictionaries_are_same(self, dict1, dict2):
-
-        self.assertEqual(sorted(list(dict1.keys())),
-                         sorted(list(dict2.keys())))
-        for key1, value1 in dict1.items():
-            if isinstance(value1, dict) or isinstance(value1, OrderedDict):
-                self.check_dictionaries_are_same(value1, dict2[key1])
-            elif isinstance(value1, np.ndarray):
-                try:
-                    if value1.dtype.type == np.unicode_:
-                        self.assertTrue((value1 == dict2[key1]).all())
-                    else:
-                        # NaN==NaN will return False, so only index
-                        # where not NaN.
-                        not_nan_array = np.logical_not(np.isnan(value1))
-                        other_not_nan_array = \
-                            np.logical_not(np.isnan(dict2[key1]))
-                        self.assertTrue(
-                            (not_nan_array == other_not_nan_array).all())
-                        self.assertTrue(
-                            (value1[not_nan_array] ==
-                                dict2[key1][not_nan_array]).all())
-                except (AssertionError, TypeError, AttributeError):
-                    print(key1, value1.dtype)
-                    raise
-            elif key1 == 'experiment_comment':
-                continue  # combf has filename inside, can differ
-            else:
-                try:
-                    self.assertEqual(value1, dict2[key1])
-                except AssertionError:
-                    print(key1, value1, dict2[key1])
-                    raise
+        # Nested records are walked with a stack rather than recursion
+        stack = [(dict1, dict2)]
+        while stack:
+            dict1, dict2 = stack.pop()
+            self.assertEqual(sorted(dict1.keys()), sorted(dict2.keys()))
+            for key1, value1 in dict1.items():
+                if isinstance(value1, Mapping):
+                    stack.append((value1, dict2[key1]))
+                elif isinstance(value1, np.ndarray):
+                    value2 = dict2[key1]
+                    try:
+                        # NaN==NaN will return False, so NaN in the same
+                        # place in both float arrays also counts as equal.
+                        equal_nan = np.issubdtype(value1.dtype, np.inexact)
+                        self.assertTrue(np.array_equal(value1, value2,
+                                                       equal_nan=equal_nan))
+                    except (AssertionError, TypeError, AttributeError):
+                        print(key1, value1.dtype)
+                        raise
+                elif key1 == 'experiment_comment':
+                    continue  # combf has filename inside, can differ
+                else:
+                    try:
+                        self.assertEqual(value1, dict2[key1])
+                    except AssertionError:
+                        print(key1, value1, dict2[key1])
+                        raise
 
         return True
 
+    def check_read_write(self, source_file, write_file, filetype,
+                         file_structure):
+        """
+        Reads the source file, writes its records or arrays to write_file
+        and checks that reading write_file gives back the same data.
+        """
+        dm = read_source_file(source_file, filetype, file_structure)
+        if file_structure == 'site':
+            data = dm.records
+        else:
+            data = dm.arrays
+        pydarnio.BorealisWrite(write_file, data, filetype, file_structure)
+        self.assertTrue(os.path.isfile(write_file))
+        dm2 = pydarnio.BorealisRead(write_file, filetype, file_structure)
+        if file_structure == 'site':
+            new_data = dm2.records
+        else:
+            new_data = dm2.arrays
+        dictionaries_are_same = self.check_dictionaries_are_same(data,
+                                                                 new_data)
+        self.assertTrue(dictionaries_are_same)
+
     def test_read_write_site_rawacf(self):
         """
         Test reading and then writing site rawacf data to a file.
@@ -116,21 +161,8 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - records that pass the read from a file can then be written
             - records written and then read are the same as original
         """
-        dm = pydarnio.BorealisRead(self.source_rawacf_site_file, 'rawacf',
-                                   'site')
-        records = dm.records
-        _ = pydarnio.BorealisWrite(self.write_rawacf_site_file,
-                                   records, 'rawacf', 'site')
-        self.assertTrue(os.path.isfile(self.write_rawacf_site_file))
-        dm2 = pydarnio.BorealisRead(self.write_rawacf_site_file, 'rawacf',
-                                    'site')
-        new_records = dm2.records
-        dictionaries_are_same = self.check_dictionaries_are_same(records,
-                                                                 new_records)
-        self.assertTrue(dictionaries_are_same)
-
-        os.remove(self.write_rawacf_site_file)
-        del _, dm, dm2, records, new_records
+        self.check_read_write(self.source_rawacf_site_file,
+                              self.write_rawacf_site_file, 'rawacf', 'site')
 
     def test_read_write_array_rawacf(self):
         """
@@ -140,22 +172,8 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - arrays that pass the read from a file can then be written
             - arrays written and then read are the same as original
         """
-        dm = pydarnio.BorealisRead(self.source_rawacf_array_file, 'rawacf',
-                                   'array')
-        arrays = dm.arrays
-        _ = pydarnio.BorealisWrite(self.write_rawacf_array_file,
-                                   arrays, 'rawacf',
-                                   'array')
-        self.assertTrue(os.path.isfile(self.write_rawacf_array_file))
-        dm2 = pydarnio.BorealisRead(self.write_rawacf_array_file, 'rawacf',
-                                    'array')
-        new_arrays = dm2.arrays
-        dictionaries_are_same = self.check_dictionaries_are_same(arrays,
-                                                                 new_arrays)
-        self.assertTrue(dictionaries_are_same)
-
-        os.remove(self.write_rawacf_array_file)
-        del _, dm, dm2, arrays, new_arrays
+        self.check_read_write(self.source_rawacf_array_file,
+                              self.write_rawacf_array_file, 'rawacf', 'array')
 
     def test_read_site_write_array_rawacf(self):
         """
@@ -167,15 +185,14 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - records restructured, written as arrays, read as arrays,
                 restructured back to records are the same as original records
         """
-        dm = pydarnio.BorealisRead(self.source_rawacf_site_file, 'rawacf',
-                                   'site')
+        dm = read_source_file(self.source_rawacf_site_file, 'rawacf', 'site')
         records = dm.records
 
         arrays = dm.arrays  # restructuring happens here
-        _ = pydarnio.BorealisWrite(self.write_rawacf_array_file,
-                                   arrays, 'rawacf',
-                                   'array')
-        del dm, arrays
+        pydarnio.BorealisWrite(self.write_rawacf_array_file,
+                               arrays, 'rawacf',
+                               'array')
+        del arrays
         self.assertTrue(os.path.isfile(self.write_rawacf_array_file))
         dm2 = pydarnio.BorealisRead(self.write_rawacf_array_file, 'rawacf',
                                     'array')
@@ -185,9 +202,6 @@ class IntegrationBorealisRestructure(unittest.TestCase):
                                                                  new_records)
         self.assertTrue(dictionaries_are_same)
 
-        os.remove(self.write_rawacf_array_file)
-        del _, dm2, records, new_records
-
     def test_read_array_write_site_rawacf(self):
         """
         Test reading, restructuring, writing, restructuring rawacf.
@@ -198,14 +212,13 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - arrays restructured, written as records, read as records,
                 restructured back to arrays are the same as original arrays
         """
-        dm = pydarnio.BorealisRead(self.source_rawacf_array_file, 'rawacf',
-                                   'array')
+        dm = read_source_file(self.source_rawacf_array_file, 'rawacf', 'array')
         arrays = dm.arrays
 
         records = dm.records  # restructuring happens here
-        _ = pydarnio.BorealisWrite(self.write_rawacf_site_file, records,
-                                   'rawacf', 'site')
-        del dm, records
+        pydarnio.BorealisWrite(self.write_rawacf_site_file, records,
+                               'rawacf', 'site')
+        del records
         self.assertTrue(os.path.isfile(self.write_rawacf_site_file))
         dm2 = pydarnio.BorealisRead(self.write_rawacf_site_file, 'rawacf',
                                     'site')
@@ -215,9 +228,6 @@ class IntegrationBorealisRestructure(unittest.TestCase):
                                                                  new_arrays)
         self.assertTrue(dictionaries_are_same)
 
-        os.remove(self.write_rawacf_site_file)
-        del _, dm2, arrays, new_arrays
-
     def test_read_write_site_bfiq(self):
         """
         Test reading and then writing site bfiq data to a file.
@@ -226,22 +236,8 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - records that pass the read from a file can then be written
             - records written and then read are the same as original
         """
-        dm = pydarnio.BorealisRead(self.source_bfiq_site_file, 'bfiq',
-                                   'site')
-        records = dm.records
-        _ = pydarnio.BorealisWrite(self.write_bfiq_site_file,
-                                   records, 'bfiq',
-                                   'site')
-        self.assertTrue(os.path.isfile(self.write_bfiq_site_file))
-        dm2 = pydarnio.BorealisRead(self.write_bfiq_site_file, 'bfiq',
-                                    'site')
-        new_records = dm2.records
-        dictionaries_are_same = self.check_dictionaries_are_same(records,
-                                                                 new_records)
-        self.assertTrue(dictionaries_are_same)
-
-        os.remove(self.write_bfiq_site_file)
-        del _, dm, dm2, records, new_records
+        self.check_read_write(self.source_bfiq_site_file,
+                              self.write_bfiq_site_file, 'bfiq', 'site')
 
     def test_read_write_array_bfiq(self):
         """
@@ -251,22 +247,8 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - arrays that pass the read from a file can then be written
             - arrays written and then read are the same as original
         """
-        dm = pydarnio.BorealisRead(self.source_bfiq_array_file, 'bfiq',
-                                   'array')
-        arrays = dm.arrays
-        _ = pydarnio.BorealisWrite(self.write_bfiq_array_file,
-                                   arrays, 'bfiq',
-                                   'array')
-        self.assertTrue(os.path.isfile(self.write_bfiq_array_file))
-        dm2 = pydarnio.BorealisRead(self.write_bfiq_array_file, 'bfiq',
-                                    'array')
-        new_arrays = dm2.arrays
-        dictionaries_are_same = self.check_dictionaries_are_same(arrays,
-                                                                 new_arrays)
-        self.assertTrue(dictionaries_are_same)
-
-        os.remove(self.write_bfiq_array_file)
-        del _, dm, dm2, arrays, new_arrays
+        self.check_read_write(self.source_bfiq_array_file,
+                              self.write_bfiq_array_file, 'bfiq', 'array')
 
     def test_read_site_write_array_bfiq(self):
         """
@@ -278,15 +260,14 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - records restructured, written as arrays, read as arrays,
                 restructured back to records are the same as original records
         """
-        dm = pydarnio.BorealisRead(self.source_bfiq_site_file, 'bfiq',
-                                   'site')
+        dm = read_source_file(self.source_bfiq_site_file, 'bfiq', 'site')
         records = dm.records
 
         arrays = dm.arrays  # restructuring happens here
-        _ = pydarnio.BorealisWrite(self.write_bfiq_array_file,
-                                   arrays, 'bfiq',
-                                   'array')
-        del dm, arrays
+        pydarnio.BorealisWrite(self.write_bfiq_array_file,
+                               arrays, 'bfiq',
+                               'array')
+        del arrays
         self.assertTrue(os.path.isfile(self.write_bfiq_array_file))
         dm2 = pydarnio.BorealisRead(self.write_bfiq_array_file, 'bfiq',
                                     'array')
@@ -296,9 +277,6 @@ class IntegrationBorealisRestructure(unittest.TestCase):
                                                                  new_records)
         self.assertTrue(dictionaries_are_same)
 
-        os.remove(self.write_bfiq_array_file)
-        del _, dm2, records, new_records
-
     def test_read_array_write_site_bfiq(self):
         """
         Test reading, restructuring, writing, restructuring bfiq.
@@ -309,15 +287,14 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - arrays restructured, written as records, read as records,
                 restructured back to arrays are the same as original arrays
         """
-        dm = pydarnio.BorealisRead(self.source_bfiq_array_file, 'bfiq',
-                                   'array')
+        dm = read_source_file(self.source_bfiq_array_file, 'bfiq', 'array')
         arrays = dm.arrays
 
         records = dm.records  # restructuring happens here
-        _ = pydarnio.BorealisWrite(self.write_bfiq_site_file,
-                                   records, 'bfiq',
-                                   'site')
-        del dm, records
+        pydarnio.BorealisWrite(self.write_bfiq_site_file,
+                               records, 'bfiq',
+                               'site')
+        del records
         self.assertTrue(os.path.isfile(self.write_bfiq_site_file))
         dm2 = pydarnio.BorealisRead(self.write_bfiq_site_file, 'bfiq',
                                     'site')
@@ -327,9 +304,6 @@ class IntegrationBorealisRestructure(unittest.TestCase):
                                                                  new_arrays)
         self.assertTrue(dictionaries_are_same)
 
-        os.remove(self.write_bfiq_site_file)
-        del _, dm2, arrays, new_arrays
-
     def test_read_write_site_antennas_iq(self):
         """
         Test reading and then writing site antennas_iq data to a file.
@@ -338,24 +312,9 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - records that pass the read from a file can then be written
             - records written and then read are the same as original
         """
-        dm = pydarnio.BorealisRead(self.source_antennas_iq_site_file,
-                                   'antennas_iq',
-                                   'site')
-        records = dm.records
-        _ = pydarnio.BorealisWrite(self.write_antennas_iq_site_file,
-                                   records, 'antennas_iq',
-                                   'site')
-        self.assertTrue(os.path.isfile(self.write_antennas_iq_site_file))
-        dm2 = pydarnio.BorealisRead(self.write_antennas_iq_site_file,
-                                    'antennas_iq',
-                                    'site')
-        new_records = dm2.records
-        dictionaries_are_same = self.check_dictionaries_are_same(records,
-                                                                 new_records)
-        self.assertTrue(dictionaries_are_same)
-
-        os.remove(self.write_antennas_iq_site_file)
-        del _, dm, dm2, records, new_records
+        self.check_read_write(self.source_antennas_iq_site_file,
+                              self.write_antennas_iq_site_file,
+                              'antennas_iq', 'site')
 
     def test_read_write_array_antennas_iq(self):
         """
@@ -366,24 +325,9 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - arrays that pass the read from a file can then be written
             - arrays written and then read are the same as original
         """
-        dm = pydarnio.BorealisRead(self.source_antennas_iq_array_file,
-                                   'antennas_iq',
-                                   'array')
-        arrays = dm.arrays
-        _ = pydarnio.BorealisWrite(self.write_antennas_iq_array_file,
-                                   arrays, 'antennas_iq',
-                                   'array')
-        self.assertTrue(os.path.isfile(self.write_antennas_iq_array_file))
-        dm2 = pydarnio.BorealisRead(self.write_antennas_iq_array_file,
-                                    'antennas_iq',
-                                    'array')
-        new_arrays = dm2.arrays
-        dictionaries_are_same = self.check_dictionaries_are_same(arrays,
-                                                                 new_arrays)
-        self.assertTrue(dictionaries_are_same)
-
-        os.remove(self.write_antennas_iq_array_file)
-        del _, dm, dm2, arrays, new_arrays
+        self.check_read_write(self.source_antennas_iq_array_file,
+                              self.write_antennas_iq_array_file,
+                              'antennas_iq', 'array')
 
     def test_read_site_write_array_antennas_iq(self):
         """
@@ -395,19 +339,16 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - records restructured, written as arrays, read as arrays,
                 restructured back to records are the same as original records
         """
-        dm = pydarnio.BorealisRead(self.source_antennas_iq_site_file,
-                                   'antennas_iq',
-                                   'site')
+        dm = read_source_file(self.source_antennas_iq_site_file,
+                              'antennas_iq',
+                              'site')
         records = dm.records
 
         arrays = dm.arrays  # restructuring happens here
-        del dm
-        gc.collect()
-        writer = pydarnio.BorealisWrite(self.write_antennas_iq_array_file,
-                                        arrays, 'antennas_iq',
-                                        'array')
-        del arrays, writer
-        gc.collect()
+        pydarnio.BorealisWrite(self.write_antennas_iq_array_file,
+                               arrays, 'antennas_iq',
+                               'array')
+        del arrays
         self.assertTrue(os.path.isfile(self.write_antennas_iq_array_file))
         dm2 = pydarnio.BorealisRead(self.write_antennas_iq_array_file,
                                     'antennas_iq',
@@ -418,9 +359,6 @@ class IntegrationBorealisRestructure(unittest.TestCase):
                                                                  new_records)
         self.assertTrue(dictionaries_are_same)
 
-        os.remove(self.write_antennas_iq_array_file)
-        del dm2, records, new_records
-
     def test_read_array_write_site_antennas_iq(self):
         """
         Test reading, restructuring, writing, restructuring antennas_iq.
@@ -431,16 +369,14 @@ class IntegrationBorealisRestructure(unittest.TestCase):
             - arrays restructured, written as records, read as records,
                 restructured back to arrays are the same as original arrays
         """
-        dm = pydarnio.BorealisRead(self.source_antennas_iq_array_file,
-                                   'antennas_iq',
-                                   'array')
+        dm = read_source_file(self.source_antennas_iq_array_file,
+                              'antennas_iq',
+                              'array')
         arrays = dm.arrays
 
-        writer = pydarnio.BorealisWrite(self.write_antennas_iq_site_file,
-                                        dm.records, 'antennas_iq',
-                                        'site')
-        del dm, writer
-        gc.collect()
+        pydarnio.BorealisWrite(self.write_antennas_iq_site_file,
+                               dm.records, 'antennas_iq',
+                               'site')
         self.assertTrue(os.path.isfile(self.write_antennas_iq_site_file))
         dm2 = pydarnio.BorealisRead(self.write_antennas_iq_site_file,
                                     'antennas_iq',
@@ -451,9 +387,6 @@ class IntegrationBorealisRestructure(unittest.TestCase):
                                                                  new_arrays)
         self.assertTrue(dictionaries_are_same)
 
-        os.remove(self.write_antennas_iq_site_file)
-        del dm2, arrays, new_arrays
-
 
 # TODO ADD FAILURE TESTS FOR CONVERT (converting to wrong filetype, etc.)
 if __name__ == '__main__':
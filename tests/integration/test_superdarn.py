@@ -1,11 +1,13 @@
 # Copyright (C) 2019 SuperDARN
 # Author: Marina Schmidt
 import bz2
-import copy
 import logging
 import numpy as np
 import os
+import shutil
+import tempfile
 import unittest
+from functools import lru_cache
 
 import pydarnio
 
@@ -31,157 +33,226 @@ grid_stream = "../testfiles/20180220.C0.rkn.stream.grid.bz2"
 pydarnio_logger = logging.getLogger('pydarnio')
 
 
+@lru_cache(maxsize=None)
+def read_stream(filename: str) -> bytes:
+    """
+    Returns the decompressed bytes of a bz2 compressed DMap stream file,
+    cached so each stream is only decompressed once per run
+    """
+    with open(filename, 'rb') as fp:
+        return bz2.decompress(fp.read())
+
+
+@lru_cache(maxsize=None)
+def read_darn_stream(filename: str, read_method) -> pydarnio.SDarnRead:
+    """
+    Returns a SDarnRead of the bz2 compressed stream file that has read its
+    records with read_method, a SDarnRead read method. Tests reading the
+    same stream share the reader and must not modify its records.
+    """
+    darn_read = pydarnio.SDarnRead(read_stream(filename), True)
+    read_method(darn_read)
+    return darn_read
+
+
+def copy_records(dmap_records: list) -> list:
+    """
+    Returns a copy of the DMap records that shares the field values with
+    the original records.
+
+    DmapWrite reverses the shape list of a multi-dimensional DmapArray in
+    place when writing it, so each DmapArray gets its own shape list.
+    """
+    return [type(record)((field, value._replace(shape=list(value.shape))
+                          if isinstance(value, pydarnio.DmapArray)
+                          else value)
+                         for field, value in record.items())
+            for record in dmap_records]
+
+
 class IntegrationSuperdarnio(unittest.TestCase):
-    def setUp(self):
-        self.test_file = ''
+    @classmethod
+    def setUpClass(cls):
+        # dict2dmap does not modify the dictionaries it converts
+        cls.rawacf_dict_dmap = \
+            pydarnio.dict2dmap(rawacf_dict_sets.rawacf_dict_data)
 
+    def setUp(self):
+        # Files written by the tests go to a scratch directory that is
+        # removed with everything in it after each test
+        self.tmpdir = tempfile.mkdtemp()
 
     def tearDown(self):
-        if os.path.isfile(self.test_file):
-            os.remove(self.test_file)
-       del self.test_file
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def tmp_file(self, filename: str) -> str:
+        """
+        Returns the path of filename in the test's scratch directory
+        """
+        return os.path.join(self.tmpdir, filename)
 
     def dmap_compare(self, dmap1: list, dmap2: list):
         # Quick simple tests that can be done before looping
         # over the list
         self.assertEqual(len(dmap1), len(dmap2))
 
-        # NamedTuple are comparison capabilities
+        # NamedTuple are comparison capabilities, the comparison for a field
+        # is looked up by the type of its value and any other type is
+        # compared with assertEqual
+        compare = {pydarnio.DmapScalar: self.assertEqual,
+                   pydarnio.DmapArray: self.compare_dmap_array,
+                   np.ndarray: self.assert_arrays_equal}
         for record1, record2 in zip(dmap1, dmap2):
-            diff_fields1 = set(record1) - set(record2)
-            self.assertEqual(len(diff_fields1), 0)
-            diff_fields2 = set(record2) - set(record1)
-            self.assertEqual(len(diff_fields2), 0)
+            # assertSetEqual reports the fields missing from either record
+            self.assertEqual(set(record1), set(record2))
             for field, val_obj in record1.items():
-                if isinstance(val_obj, pydarnio.DmapScalar):
-                    self.assertEqual(record2[field], val_obj)
-                elif isinstance(val_obj, pydarnio.DmapArray):
-                    self.compare_dmap_array(record2[field], val_obj)
-                elif isinstance(val_obj, np.ndarray):
-                    if np.array_equal(record2[field], val_obj):
-                        self.assertTrue(np.array_equal(record2[field],
-                                                       val_obj))
-                    else:
-                        self.assertTrue(np.allclose(record2[field], val_obj,
-                                                    equal_nan=True))
-                else:
-                    self.assertEqual(val_obj, record2[field])
+                compare.get(type(val_obj), self.assertEqual)(val_obj,
+                                                             record2[field])
 
     def compare_dmap_array(self, dmaparr1, dmaparr2):
+        self.assertIsInstance(dmaparr1, pydarnio.DmapArray)
+        self.assertIsInstance(dmaparr2, pydarnio.DmapArray)
+        # metadata mismatches fail before any of the array data is compared
+        self.assertEqual(dmaparr1.name, dmaparr2.name)
+        self.assertEqual(dmaparr1.data_type, dmaparr2.data_type)
+        self.assertEqual(dmaparr1.data_type_fmt, dmaparr2.data_type_fmt)
+        self.assertEqual(dmaparr1.dimension, dmaparr2.dimension)
+        self.assert_arrays_equal(self.shaped_value(dmaparr1),
+                                 self.shaped_value(dmaparr2))
+
+    @staticmethod
+    def shaped_value(dmaparr) -> np.ndarray:
+        """
+        Returns the DmapArray's value in its DMap shape, only reshaping the
+        value when it is not already in that shape
+        """
+        if np.shape(dmaparr.value) == tuple(dmaparr.shape):
+            return dmaparr.value
+        return np.reshape(dmaparr.value, dmaparr.shape)
+
+    def check_missing_field(self, dmap_records: list, field: str,
+                            read_method):
+        """
+        Deletes field from the first record, writes the records to a stream
+        with DmapWrite and reads the stream back with read_method, a
+        SDarnRead read method, checking the field is reported as missing
+        """
+        missing_field = copy_records(dmap_records)
+        del missing_field[0][field]
+        dmap_write = pydarnio.DmapWrite()
+        dmap_stream = dmap_write.write_dmap_stream(missing_field)
+
+        darn_read = pydarnio.SDarnRead(dmap_stream, True)
         try:
-            self.assertEqual(dmaparr1.name, dmaparr2.name)
-            self.assertEqual(dmaparr1.data_type, dmaparr2.data_type)
-            self.assertEqual(dmaparr1.data_type_fmt, dmaparr2.data_type_fmt)
-            self.assertEqual(dmaparr1.dimension, dmaparr2.dimension)
-            value1 = np.reshape(dmaparr1.value, dmaparr1.shape)
-            value2 = np.reshape(dmaparr2.value, dmaparr2.shape)
-        except AttributeError:
-            self.assertEqual(dmaparr1.key, dmaparr2.key)
-        if np.array_equal(value1, value2):
-            self.assertTrue(np.array_equal(value1, value2))
-        else:
-            self.assertTrue(np.allclose(value1, value2, equal_nan=True))
+            read_method(darn_read)
+        except pydarnio.superdarn_exceptions.SuperDARNFieldMissingError as err:
+            self.assertEqual(err.fields, {field})
+            self.assertEqual(err.record_number, 0)
+
+    def check_extra_field(self, dmap_records: list, read_method):
+        """
+        Adds a dummy field to the start of the first record, writes the
+        records to a stream with DmapWrite and reads the stream back with
+        read_method, a SDarnRead read method, checking the field is reported
+        as extra
+        """
+        extra_field = copy_records(dmap_records)
+        extra_field[0] = type(extra_field[0])([('dummy', 'dummy'),
+                                               *extra_field[0].items()])
+        dmap_write = pydarnio.DmapWrite()
+        dmap_stream = dmap_write.write_dmap_stream(extra_field)
+
+        darn_read = pydarnio.SDarnRead(dmap_stream, True)
+        try:
+            read_method(darn_read)
+        except pydarnio.superdarn_exceptions.SuperDARNExtraFieldError as err:
+            self.assertEqual(err.fields, {'dummy'})
+            self.assertEqual(err.record_number, 0)
+
+    def assert_arrays_equal(self, array1: np.ndarray, array2: np.ndarray):
+        """
+        Asserts the arrays hold the same values. Floating point and complex
+        arrays may differ within np.allclose's default tolerances and have
+        NaNs in the same places, any other type has to match exactly.
+        """
+        if not np.issubdtype(array1.dtype, np.inexact):
+            np.testing.assert_array_equal(array1, array2)
+        # round trips normally give back the exact values, so the tolerance
+        # check is only needed when the exact comparison fails
+        elif not np.array_equal(array1, array2, equal_nan=True):
+            np.testing.assert_allclose(array1, array2, rtol=1e-05,
+                                       atol=1e-08, equal_nan=True)
 
     def test_DmapRead_SDarnWrite_rawacf(self):
         """
         Test DmapRead reading an rawacf and SDarnWrite writing
         the rawacf file
         """
+        test_file = self.tmp_file("test_rawacf.rawacf")
         dmap = pydarnio.DmapRead(rawacf_file)
         dmap_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_rawacf("test_rawacf.rawacf")
-        self.assertTrue(os.path.isfile("test_rawacf.rawacf"))
-        os.remove("test_rawacf.rawacf")
+        dmap_write.write_rawacf(test_file)
+        self.assertTrue(os.path.isfile(test_file))
 
     def test_SDarnWrite_SDarnRead_rawacf(self):
         """
         Test SDarnWrite writing a rawacf file and SDarnRead reading the rawacf
         file
         """
-        rawacf_data = copy.deepcopy(rawacf_data_sets.rawacf_data)
-        rawacf_write = pydarnio.SDarnWrite(rawacf_data, "test_rawacf.rawacf")
+        test_file = self.tmp_file("test_rawacf.rawacf")
+        rawacf_data = copy_records(rawacf_data_sets.rawacf_data)
+        rawacf_write = pydarnio.SDarnWrite(rawacf_data, test_file)
         rawacf_write.write_rawacf()
 
-        rawacf_read = pydarnio.SDarnRead("test_rawacf.rawacf")
+        rawacf_read = pydarnio.SDarnRead(test_file)
         rawacf_read_data = rawacf_read.read_rawacf()
         self.dmap_compare(rawacf_read_data, rawacf_data)
-        os.remove("test_rawacf.rawacf")
 
     def test_SDarnRead_stream_SDarnWrite_file_rawacf(self):
         """
         Test SDarnRead reads from a stream and SDarnWrite writes
         to a rawacf file
         """
-        with bz2.open(rawacf_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        stream_data = dmap.read_rawacf()
+        test_file = self.tmp_file("test_rawacf.rawacf")
+        dmap = read_darn_stream(rawacf_stream, pydarnio.SDarnRead.read_rawacf)
+        stream_data = dmap.get_records
         dmap_stream_data = dmap.get_dmap_records
         dmap_write = pydarnio.SDarnWrite(stream_data)
-        dmap_write.write_rawacf("test_rawacf.rawacf")
-        dmap_read = pydarnio.SDarnRead("test_rawacf.rawacf")
-        _ = dmap_read.read_records()
+        dmap_write.write_rawacf(test_file)
+        dmap_read = pydarnio.SDarnRead(test_file)
+        dmap_read.read_records()
         dmap_data = dmap_read.get_dmap_records
         self.dmap_compare(dmap_stream_data, dmap_data)
-        os.remove("test_rawacf.rawacf")
-
-    def test_DmapWrite_missing_SDarnRead_rawacf(self):
-        """
-        Test DmapWrite writes a rawacf file missing the field nave in record 2
-        and SDarnRead reads the file
 
-        Behaviour: Raise SuperDARNFieldMissingError
+    def test_DmapWrite_malformed_SDarnRead_rawacf(self):
         """
-        rawacf_missing_field = copy.deepcopy(rawacf_data_sets.rawacf_data)
-        del rawacf_missing_field[0]['nave']
-        dmap_write = pydarnio.DmapWrite(rawacf_missing_field)
-        dmap_write.write_dmap("test_missing_rawacf.rawacf")
-
-        darn_read = pydarnio.SDarnRead("test_missing_rawacf.rawacf")
-        try:
-            darn_read.read_rawacf()
-        except pydarnio.superdarn_exceptions.SuperDARNFieldMissingError as err:
-            self.assertEqual(err.fields, {'nave'})
-            self.assertEqual(err.record_number, 0)
-
-        os.remove("test_missing_rawacf.rawacf")
+        Test DmapWrite writes rawacf streams missing the field nave or with an
+        extra field in the first record and SDarnRead reads the streams
 
-    def test_DmapWrite_extra_SDarnRead_rawacf(self):
+        Behaviour: Raise SuperDARNFieldMissingError and
+                   SuperDARNExtraFieldError
         """
-        Test DmapWrite writes a rawacf file with an extra field and SDarnRead
-        reads the file
-
-        Behaviour: Raised SuperDARNExtraFieldError
-        """
-        rawacf_extra_field = copy.deepcopy(rawacf_data_sets.rawacf_data)
-        rawacf_extra_field[0].update({'dummy': 'dummy'})
-        rawacf_extra_field[0].move_to_end('dummy', last=False)
-        dmap_write = pydarnio.DmapWrite(rawacf_extra_field, )
-        dmap_write.write_dmap("test_extra_rawacf.rawacf")
-
-        darn_read = pydarnio.SDarnRead("test_extra_rawacf.rawacf")
-        try:
-            darn_read.read_rawacf()
-        except pydarnio.superdarn_exceptions.SuperDARNExtraFieldError as err:
-            self.assertEqual(err.fields, {'dummy'})
-            self.assertEqual(err.record_number, 0)
-        os.remove("test_extra_rawacf.rawacf")
+        rawacf_data = rawacf_data_sets.rawacf_data
+        read_rawacf = pydarnio.SDarnRead.read_rawacf
+        with self.subTest(kind='missing'):
+            self.check_missing_field(rawacf_data, 'nave', read_rawacf)
+        with self.subTest(kind='extra'):
+            self.check_extra_field(rawacf_data, read_rawacf)
 
     def test_dict2dmap_SDarnWrite_rawacf(self):
         """
         Test dict2dmap to convert a dictionary to dmap then SDarnWrite write
         rawacf file
         """
-        rawacf_dict_data = copy.deepcopy(rawacf_dict_sets.rawacf_dict_data)
-        dmap_rawacf = pydarnio.dict2dmap(rawacf_dict_data)
+        test_file = self.tmp_file("test_rawacf.rawacf")
+        dmap_rawacf = copy_records(self.rawacf_dict_dmap)
         darn_read = pydarnio.SDarnWrite(dmap_rawacf)
-        darn_read.write_rawacf("test_rawacf.rawacf")
-        dmap_read = pydarnio.DmapRead("test_rawacf.rawacf")
-        dmap_data = dmap_read.read_records()
+        darn_read.write_rawacf(test_file)
+        dmap_read = pydarnio.DmapRead(test_file)
+        dmap_read.read_records()
         dmap_data = dmap_read.get_dmap_records
         self.dmap_compare(dmap_data, dmap_rawacf)
-        os.remove("test_rawacf.rawacf")
 
     def test_SDarnWrite_incorrect_rawacf_from_dict(self):
         """
@@ -190,28 +261,29 @@ class IntegrationSuperdarnio(unittest.TestCase):
 
         Behaviour: Raise SuperDARNDataFormatTypeError
         """
-        rawacf_dict_data = copy.deepcopy(rawacf_dict_sets.rawacf_dict_data)
-        rawacf_dict_data[0]['stid'] = np.int8(rawacf_dict_data[0]['stid'])
-        dmap_rawacf = pydarnio.dict2dmap(rawacf_dict_data)
+        test_file = self.tmp_file("test_rawacf.rawacf")
+        stid = np.int8(rawacf_dict_sets.rawacf_dict_data[0]['stid'])
+        dmap_rawacf = copy_records(self.rawacf_dict_dmap)
+        dmap_rawacf[0].update(pydarnio.dict2dmap([{'stid': stid}])[0])
         darn_write = pydarnio.SDarnWrite(dmap_rawacf)
         with self.assertRaises(pydarnio.superdarn_exceptions.
                                SuperDARNDataFormatTypeError):
-            darn_write.write_rawacf("test_rawacf.rawacf")
+            darn_write.write_rawacf(test_file)
 
     def test_DmapWrite_incorrect_SDarnRead_rawacf_from_dict(self):
         """
         Test write an incorrect data type from a dict converting from dict2dmap
-        with DmapWrite then SDarnRead reads the file
+        with DmapWrite then SDarnRead reads the stream
 
         Behaviour: Raises SuperDARNDataFormatTypeError
         """
-        rawacf_dict_data = copy.deepcopy(rawacf_dict_sets.rawacf_dict_data)
-        rawacf_dict_data[0]['stid'] = np.int8(rawacf_dict_data[0]['stid'])
-        dmap_rawacf = pydarnio.dict2dmap(rawacf_dict_data)
-        dmap_write = pydarnio.DmapWrite(dmap_rawacf)
-        dmap_write.write_dmap("test_incorrect_rawacf.rawacf")
+        stid = np.int8(rawacf_dict_sets.rawacf_dict_data[0]['stid'])
+        dmap_rawacf = copy_records(self.rawacf_dict_dmap)
+        dmap_rawacf[0].update(pydarnio.dict2dmap([{'stid': stid}])[0])
+        dmap_write = pydarnio.DmapWrite()
+        dmap_stream = dmap_write.write_dmap_stream(dmap_rawacf)
 
-        darn_read = pydarnio.SDarnRead("test_incorrect_rawacf.rawacf")
+        darn_read = pydarnio.SDarnRead(dmap_stream, True)
         with self.assertRaises(pydarnio.superdarn_exceptions.
                                SuperDARNDataFormatTypeError):
             darn_read.read_rawacf()
@@ -221,43 +293,42 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead reading an fitacf and SDarnWrite writing
         the fitacf file
         """
+        test_file = self.tmp_file("test_fitacf.fitacf")
         dmap = pydarnio.SDarnRead(fitacf_file)
         dmap_data = dmap.read_fitacf()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_fitacf("test_fitacf.fitacf")
-        fitacf_read = pydarnio.SDarnRead("test_fitacf.fitacf")
+        dmap_write.write_fitacf(test_file)
+        fitacf_read = pydarnio.SDarnRead(test_file)
         fitacf_read_data = fitacf_read.read_fitacf()
         self.dmap_compare(dmap_data, fitacf_read_data)
-        os.remove("test_fitacf.fitacf")
 
     def test_SDarnWrite_SDarnRead_fitacf(self):
         """
         Test SDarnWrite writing a fitacf file and SDarnRead reading the fitacf
         file
         """
-        fitacf_data = copy.deepcopy(fitacf_data_sets.fitacf_data)
-        fitacf_write = pydarnio.SDarnWrite(fitacf_data, "test_fitacf.fitacf")
+        test_file = self.tmp_file("test_fitacf.fitacf")
+        fitacf_data = copy_records(fitacf_data_sets.fitacf_data)
+        fitacf_write = pydarnio.SDarnWrite(fitacf_data, test_file)
         fitacf_write.write_fitacf()
-        fitacf_read = pydarnio.SDarnRead("test_fitacf.fitacf")
+        fitacf_read = pydarnio.SDarnRead(test_file)
         fitacf_read_data = fitacf_read.read_fitacf()
         self.dmap_compare(fitacf_read_data, fitacf_data)
-        os.remove("test_fitacf.fitacf")
 
     def test_SDarnRead_stream_SDarnWrite_file_fitacf(self):
         """
         Test SDarnRead reads from a stream and SDarnWrite writes
         to a fitacf file
         """
-        with bz2.open(fitacf_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        stream_data = dmap.read_fitacf()
+        test_file = self.tmp_file("test_fitacf.fitacf")
+        dmap = read_darn_stream(fitacf_stream, pydarnio.SDarnRead.read_fitacf)
+        stream_data = dmap.get_records
         dmap_stream_data = dmap.get_dmap_records
         dmap_write = pydarnio.SDarnWrite(stream_data)
-        dmap_write.write_fitacf("test_fitacf.fitacf")
-        self.assertTrue(os.path.isfile("test_fitacf.fitacf"))
-        dmap = pydarnio.SDarnRead("test_fitacf.fitacf")
-        _ = dmap.read_fitacf()
+        dmap_write.write_fitacf(test_file)
+        self.assertTrue(os.path.isfile(test_file))
+        dmap = pydarnio.SDarnRead(test_file)
+        dmap.read_fitacf()
         dmap_read_data = dmap.get_dmap_records
         self.dmap_compare(dmap_stream_data, dmap_read_data)
 
@@ -266,57 +337,55 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead reading a fitacf file then writing it with SDarnWrite
         then reading it again with SDarnRead
         """
+        test_file = self.tmp_file("test_fitacf.fitacf")
         dmap = pydarnio.DmapRead(fitacf_file)
         dmap_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_fitacf("test_fitacf.fitacf")
-        darn_read = pydarnio.SDarnRead("test_fitacf.fitacf")
+        dmap_write.write_fitacf(test_file)
+        darn_read = pydarnio.SDarnRead(test_file)
         fitacf_data = darn_read.read_fitacf()
         self.dmap_compare(dmap_data, fitacf_data)
-        os.remove("test_fitacf.fitacf")
 
     def test_SDarnWrite_file_SDarnRead_fitacf(self):
         """
         Test SDarnWrite to write a fitacf file then using
         SDarnRead to read the file
         """
-        fitacf_data = copy.deepcopy(fitacf_data_sets.fitacf_data)
-        fitacf_write = pydarnio.SDarnWrite(fitacf_data, "test_fitacf.fitacf")
+        test_file = self.tmp_file("test_fitacf.fitacf")
+        fitacf_data = copy_records(fitacf_data_sets.fitacf_data)
+        fitacf_write = pydarnio.SDarnWrite(fitacf_data, test_file)
         fitacf_write.write_fitacf()
 
-        fitacf_read = pydarnio.SDarnRead("test_fitacf.fitacf")
+        fitacf_read = pydarnio.SDarnRead(test_file)
         fitacf_read_data = fitacf_read.read_fitacf()
         self.dmap_compare(fitacf_read_data, fitacf_data)
-        os.remove("test_fitacf.fitacf")
 
     def test_DmapWrite_SDarnRead_fitacf(self):
         """
         Test DmapWrite to write a fitacf file then using SDarnRead
         to read the file
         """
-        fitacf_data = copy.deepcopy(fitacf_data_sets.fitacf_data)
-        fitacf_write = pydarnio.DmapWrite(fitacf_data, "test_fitacf.fitacf")
+        test_file = self.tmp_file("test_fitacf.fitacf")
+        fitacf_data = copy_records(fitacf_data_sets.fitacf_data)
+        fitacf_write = pydarnio.DmapWrite(fitacf_data, test_file)
         fitacf_write.write_dmap()
 
-        fitacf_read = pydarnio.SDarnRead("test_fitacf.fitacf")
+        fitacf_read = pydarnio.SDarnRead(test_file)
         fitacf_read_data = fitacf_read.read_fitacf()
         self.dmap_compare(fitacf_read_data, fitacf_data)
-        os.remove("test_fitacf.fitacf")
 
     def test_SDarnRead_DmapWrite_stream_fitacf(self):
         """
         Test SDarnRead to read from a fitacf stream then
         DmapWrite to write a fitacf file from the stream
         """
-        with bz2.open(fitacf_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        stream_data = dmap.read_fitacf()
+        dmap = read_darn_stream(fitacf_stream, pydarnio.SDarnRead.read_fitacf)
+        stream_data = dmap.get_records
         dmap_stream_data = dmap.get_dmap_records
         dmap_write = pydarnio.DmapWrite()
         dmap_write_stream = dmap_write.write_dmap_stream(stream_data)
         dmap_read = pydarnio.SDarnRead(dmap_write_stream, True)
-        dmap_read_data = dmap_read.read_fitacf()
+        dmap_read.read_fitacf()
         dmap_read_data = dmap_read.get_dmap_records
 
         self.dmap_compare(dmap_stream_data, dmap_read_data)
@@ -326,25 +395,24 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead to read in a stream then have SDarnWrite the
         stream to file
         """
-        with bz2.open(fitacf_stream) as fp:
-            dmap_stream = fp.read()
+        test_file = self.tmp_file("test_fitacf.fitacf")
+        dmap_stream = read_stream(fitacf_stream)
         dmap = pydarnio.DmapRead(dmap_stream, True)
         stream_data = dmap.read_records()
         dmap_stream_data = dmap.get_dmap_records
         dmap_write = pydarnio.SDarnWrite(stream_data)
-        dmap_write.write_fitacf("test_fitacf.fitacf")
-        dmap = pydarnio.SDarnRead("test_fitacf.fitacf")
-        dmap_data = dmap.read_fitacf()
+        dmap_write.write_fitacf(test_file)
+        dmap = pydarnio.SDarnRead(test_file)
+        dmap.read_fitacf()
         dmap_data = dmap.get_dmap_records
         self.dmap_compare(dmap_stream_data, dmap_data)
-        os.remove("test_fitacf.fitacf")
 
     def test_DmapWrite_stream_SDarnRead_fitacf(self):
         """
         Test DmapWrite to write to a stream and have SDarnRead
         the fitacf stream
         """
-        fitacf_data = copy.deepcopy(fitacf_data_sets.fitacf_data)
+        fitacf_data = copy_records(fitacf_data_sets.fitacf_data)
         fitacf_write = pydarnio.DmapWrite()
         fitacf_stream = fitacf_write.write_dmap_stream(fitacf_data)
 
@@ -352,91 +420,62 @@ class IntegrationSuperdarnio(unittest.TestCase):
         fitacf_read_data = fitacf_read.read_fitacf()
         self.dmap_compare(fitacf_read_data, fitacf_data)
 
-    def test_DmapWrite_missing_SDarnRead_fitacf(self):
+    def test_DmapWrite_malformed_SDarnRead_fitacf(self):
         """
-        Test DmapWrite writes a fitacf file missing the field nave in record 2
-        and SDarnRead reads the file
+        Test DmapWrite writes fitacf streams missing the field nave or with an
+        extra field in the first record and SDarnRead reads the streams
 
-        Behaviour: Raise SuperDARNFieldMissingError
+        Behaviour: Raise SuperDARNFieldMissingError and
+                   SuperDARNExtraFieldError
         """
-        fitacf_missing_field = copy.deepcopy(fitacf_data_sets.fitacf_data)
-        del fitacf_missing_field[0]['nave']
-        dmap_write = pydarnio.DmapWrite(fitacf_missing_field)
-        dmap_write.write_dmap("test_missing_fitacf.fitacf")
-
-        darn_read = pydarnio.SDarnRead("test_missing_fitacf.fitacf")
-        try:
-            darn_read.read_fitacf()
-        except pydarnio.superdarn_exceptions.SuperDARNFieldMissingError as err:
-            self.assertEqual(err.fields, {'nave'})
-            self.assertEqual(err.record_number, 0)
-
-        os.remove("test_missing_fitacf.fitacf")
-
-    def test_DmapWrite_extra_SDarnRead_fitacf(self):
-        """
-        Test DmapWrite writes a fitacf file with an extra field and SDarnRead
-        reads the file
-
-        Behaviour: Raised SuperDARNExtraFieldError
-        """
-
-        fitacf_extra_field = copy.deepcopy(fitacf_data_sets.fitacf_data)
-        fitacf_extra_field[0].update({'dummy': 'dummy'})
-        fitacf_extra_field[0].move_to_end('dummy', last=False)
-        dmap_write = pydarnio.DmapWrite(fitacf_extra_field, )
-        dmap_write.write_dmap("test_extra_fitacf.fitacf")
-
-        darn_read = pydarnio.SDarnRead("test_extra_fitacf.fitacf")
-        try:
-            darn_read.read_fitacf()
-        except pydarnio.superdarn_exceptions.SuperDARNExtraFieldError as err:
-            self.assertEqual(err.fields, {'dummy'})
-            self.assertEqual(err.record_number, 0)
-        os.remove("test_extra_fitacf.fitacf")
+        fitacf_data = fitacf_data_sets.fitacf_data
+        read_fitacf = pydarnio.SDarnRead.read_fitacf
+        with self.subTest(kind='missing'):
+            self.check_missing_field(fitacf_data, 'nave', read_fitacf)
+        with self.subTest(kind='extra'):
+            self.check_extra_field(fitacf_data, read_fitacf)
 
     def test_SDarnRead_SDarnWrite_iqdat(self):
         """
         Test DmapRead reading an fitacf and SDarnWrite writing
         the fitacf file
         """
+        test_file = self.tmp_file("test_iqdat.iqdat")
         dmap = pydarnio.SDarnRead(iqdat_file)
         dmap_data = dmap.read_iqdat()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_iqdat("test_iqdat.iqdat")
-        iqdat_read = pydarnio.SDarnRead("test_iqdat.iqdat")
+        dmap_write.write_iqdat(test_file)
+        iqdat_read = pydarnio.SDarnRead(test_file)
         iqdat_read_data = iqdat_read.read_iqdat()
         self.dmap_compare(dmap_data, iqdat_read_data)
-        os.remove("test_iqdat.iqdat")
 
     def test_SDarnWrite_SDarnRead_iqdat(self):
         """
         Test SDarnWrite writing a iqdat file and SDarnRead reading the iqdat
         file
         """
-        iqdat_data = copy.deepcopy(iqdat_data_sets.iqdat_data)
-        iqdat_write = pydarnio.SDarnWrite(iqdat_data, "test_iqdat.iqdat")
+        test_file = self.tmp_file("test_iqdat.iqdat")
+        iqdat_data = copy_records(iqdat_data_sets.iqdat_data)
+        iqdat_write = pydarnio.SDarnWrite(iqdat_data, test_file)
         iqdat_write.write_iqdat()
-        iqdat_read = pydarnio.SDarnRead("test_iqdat.iqdat")
+        iqdat_read = pydarnio.SDarnRead(test_file)
         iqdat_read_data = iqdat_read.read_iqdat()
         self.dmap_compare(iqdat_read_data, iqdat_data)
-        os.remove("test_iqdat.iqdat")
 
     def test_SDarnRead_stream_SDarnWrite_file_iqdat(self):
         """
         Test SDarnRead reads from a stream and SDarnWrite writes
         to a iqdat file
         """
-        with bz2.open(iqdat_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        stream_data = dmap.read_iqdat()
+        test_file = self.tmp_file("test_iqdat.iqdat")
+        dmap = read_darn_stream(iqdat_stream, pydarnio.SDarnRead.read_iqdat)
+        stream_data = dmap.get_records
         dmap_stream_data = dmap.get_dmap_records
         dmap_write = pydarnio.SDarnWrite(stream_data)
-        dmap_write.write_iqdat("test_iqdat.iqdat")
-        self.assertTrue(os.path.isfile("test_iqdat.iqdat"))
-        dmap = pydarnio.SDarnRead("test_iqdat.iqdat")
-        _ = dmap.read_iqdat()
+        dmap_write.write_iqdat(test_file)
+        self.assertTrue(os.path.isfile(test_file))
+        dmap = pydarnio.SDarnRead(test_file)
+        dmap.read_iqdat()
         dmap_read_data = dmap.get_dmap_records
         self.dmap_compare(dmap_stream_data, dmap_read_data)
 
@@ -445,52 +484,50 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test SDarnRead reads from a stream and SDarnWrite writes
         to a iqdat file
         """
+        test_file = self.tmp_file("test_iqdat.iqdat")
         dmap = pydarnio.DmapRead(iqdat_file)
         dmap_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_iqdat("test_iqdat.iqdat")
-        darn_read = pydarnio.SDarnRead("test_iqdat.iqdat")
+        dmap_write.write_iqdat(test_file)
+        darn_read = pydarnio.SDarnRead(test_file)
         iqdat_data = darn_read.read_iqdat()
         self.dmap_compare(dmap_data, iqdat_data)
-        os.remove("test_iqdat.iqdat")
 
     def test_SDarnWrite_file_SDarnRead_iqdat(self):
         """
         Test SDarnWrite to write a iqdat file then using
         SDarnRead to read the file
         """
-        iqdat_data = copy.deepcopy(iqdat_data_sets.iqdat_data)
-        iqdat_write = pydarnio.SDarnWrite(iqdat_data, "test_iqdat.iqdat")
+        test_file = self.tmp_file("test_iqdat.iqdat")
+        iqdat_data = copy_records(iqdat_data_sets.iqdat_data)
+        iqdat_write = pydarnio.SDarnWrite(iqdat_data, test_file)
         iqdat_write.write_iqdat()
 
-        iqdat_read = pydarnio.SDarnRead("test_iqdat.iqdat")
+        iqdat_read = pydarnio.SDarnRead(test_file)
         iqdat_read_data = iqdat_read.read_iqdat()
         self.dmap_compare(iqdat_read_data, iqdat_data)
-        os.remove("test_iqdat.iqdat")
 
     def test_DmapWrite_SDarnRead_iqdat(self):
         """
         Test DmapWrite to write a iqdat file then using SDarnRead
         to read the file
         """
-        iqdat_data = copy.deepcopy(iqdat_data_sets.iqdat_data)
-        iqdat_write = pydarnio.DmapWrite(iqdat_data, "test_iqdat.iqdat")
+        test_file = self.tmp_file("test_iqdat.iqdat")
+        iqdat_data = copy_records(iqdat_data_sets.iqdat_data)
+        iqdat_write = pydarnio.DmapWrite(iqdat_data, test_file)
         iqdat_write.write_dmap()
 
-        iqdat_read = pydarnio.SDarnRead("test_iqdat.iqdat")
+        iqdat_read = pydarnio.SDarnRead(test_file)
         iqdat_read_data = iqdat_read.read_iqdat()
         self.dmap_compare(iqdat_read_data, iqdat_data)
-        os.remove("test_iqdat.iqdat")
 
     def test_SDarnRead_DmapWrite_stream_iqdat(self):
         """
         Test SDarnRead to read from a iqdat stream then
         DmapWrite to write a iqdat file from the stream
         """
-        with bz2.open(iqdat_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        dmap_stream_data = dmap.read_iqdat()
+        dmap = read_darn_stream(iqdat_stream, pydarnio.SDarnRead.read_iqdat)
+        dmap_stream_data = dmap.get_records
         dmap_write = pydarnio.DmapWrite()
         dmap_write_stream = dmap_write.write_dmap_stream(dmap_stream_data)
         dmap_read = pydarnio.SDarnRead(dmap_write_stream, True)
@@ -502,23 +539,22 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead to read in a stream then have SDarnWrite the
         stream to file
         """
-        with bz2.open(iqdat_stream) as fp:
-            dmap_stream = fp.read()
+        test_file = self.tmp_file("test_iqdat.iqdat")
+        dmap_stream = read_stream(iqdat_stream)
         dmap = pydarnio.DmapRead(dmap_stream, True)
         dmap_stream_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_stream_data)
-        dmap_write.write_iqdat("test_iqdat.iqdat")
-        dmap = pydarnio.SDarnRead("test_iqdat.iqdat")
+        dmap_write.write_iqdat(test_file)
+        dmap = pydarnio.SDarnRead(test_file)
         dmap_data = dmap.read_iqdat()
         self.dmap_compare(dmap_stream_data, dmap_data)
-        os.remove("test_iqdat.iqdat")
 
     def test_DmapWrite_stream_SDarnRead_iqdat(self):
         """
         Test DmapWrite to write to a stream and have SDarnRead
         the iqdat stream
         """
-        iqdat_data = copy.deepcopy(iqdat_data_sets.iqdat_data)
+        iqdat_data = copy_records(iqdat_data_sets.iqdat_data)
         iqdat_write = pydarnio.DmapWrite()
         iqdat_stream = iqdat_write.write_dmap_stream(iqdat_data)
 
@@ -526,89 +562,61 @@ class IntegrationSuperdarnio(unittest.TestCase):
         iqdat_read_data = iqdat_read.read_iqdat()
         self.dmap_compare(iqdat_read_data, iqdat_data)
 
-    def test_DmapWrite_missing_SDarnRead_iqdat(self):
+    def test_DmapWrite_malformed_SDarnRead_iqdat(self):
         """
-        Test DmapWrite writes a iqdat file missing the field nave in record 2
-        and SDarnRead reads the file
+        Test DmapWrite writes iqdat streams missing the field nave or with an
+        extra field in the first record and SDarnRead reads the streams
 
-        Behaviour: Raise SuperDARNFieldMissingError
+        Behaviour: Raise SuperDARNFieldMissingError and
+                   SuperDARNExtraFieldError
         """
-        iqdat_missing_field = copy.deepcopy(iqdat_data_sets.iqdat_data)
-        del iqdat_missing_field[0]['nave']
-        dmap_write = pydarnio.DmapWrite(iqdat_missing_field)
-        dmap_write.write_dmap("test_missing_iqdat.iqdat")
-
-        darn_read = pydarnio.SDarnRead("test_missing_iqdat.iqdat")
-        try:
-            darn_read.read_iqdat()
-        except pydarnio.superdarn_exceptions.SuperDARNFieldMissingError as err:
-            self.assertEqual(err.fields, {'nave'})
-            self.assertEqual(err.record_number, 0)
-
-        os.remove("test_missing_iqdat.iqdat")
-
-    def test_DmapWrite_extra_SDarnRead_iqdat(self):
-        """
-        Test DmapWrite writes a iqdat file with an extra field and SDarnRead
-        reads the file
-
-        Behaviour: Raised SuperDARNExtraFieldError
-        """
-        iqdat_extra_field = copy.deepcopy(iqdat_data_sets.iqdat_data)
-        iqdat_extra_field[0].update({'dummy': 'dummy'})
-        iqdat_extra_field[0].move_to_end('dummy', last=False)
-        dmap_write = pydarnio.DmapWrite(iqdat_extra_field, )
-        dmap_write.write_dmap("test_extra_iqdat.iqdat")
-
-        darn_read = pydarnio.SDarnRead("test_extra_iqdat.iqdat")
-        try:
-            darn_read.read_iqdat()
-        except pydarnio.superdarn_exceptions.SuperDARNExtraFieldError as err:
-            self.assertEqual(err.fields, {'dummy'})
-            self.assertEqual(err.record_number, 0)
-        os.remove("test_extra_iqdat.iqdat")
+        iqdat_data = iqdat_data_sets.iqdat_data
+        read_iqdat = pydarnio.SDarnRead.read_iqdat
+        with self.subTest(kind='missing'):
+            self.check_missing_field(iqdat_data, 'nave', read_iqdat)
+        with self.subTest(kind='extra'):
+            self.check_extra_field(iqdat_data, read_iqdat)
 
     def test_SDarnRead_SDarnWrite_grid(self):
         """
         Test DmapRead reading an grid and SDarnWrite writing
         the grid file
         """
+        test_file = self.tmp_file("test_grid.grid")
         dmap = pydarnio.SDarnRead(grid_file)
         dmap_data = dmap.read_grid()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_grid("test_grid.grid")
-        grid_read = pydarnio.SDarnRead("test_grid.grid")
+        dmap_write.write_grid(test_file)
+        grid_read = pydarnio.SDarnRead(test_file)
         grid_read_data = grid_read.read_grid()
         self.dmap_compare(dmap_data, grid_read_data)
-        os.remove("test_grid.grid")
 
     def test_SDarnWrite_SDarnRead_grid(self):
         """
         Test SDarnWrite writing a grid file and SDarnRead reading the grid
         file
         """
-        grid_data = copy.deepcopy(grid_data_sets.grid_data)
-        grid_write = pydarnio.SDarnWrite(grid_data, "test_grid.grid")
+        test_file = self.tmp_file("test_grid.grid")
+        grid_data = copy_records(grid_data_sets.get_grid_data())
+        grid_write = pydarnio.SDarnWrite(grid_data, test_file)
         grid_write.write_grid()
 
-        grid_read = pydarnio.SDarnRead("test_grid.grid")
+        grid_read = pydarnio.SDarnRead(test_file)
         grid_read_data = grid_read.read_grid()
         self.dmap_compare(grid_read_data, grid_data)
-        os.remove("test_grid.grid")
 
     def test_SDarnRead_stream_SDarnWrite_file_grid(self):
         """
         Test SDarnRead reads from a stream and SDarnWrite writes
         to a grid file
         """
-        with bz2.open(grid_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        dmap_stream_data = dmap.read_grid()
+        test_file = self.tmp_file("test_grid.grid")
+        dmap = read_darn_stream(grid_stream, pydarnio.SDarnRead.read_grid)
+        dmap_stream_data = dmap.get_records
         dmap_write = pydarnio.SDarnWrite(dmap_stream_data)
-        dmap_write.write_grid("test_grid.grid")
-        self.assertTrue(os.path.isfile("test_grid.grid"))
-        dmap = pydarnio.SDarnRead("test_grid.grid")
+        dmap_write.write_grid(test_file)
+        self.assertTrue(os.path.isfile(test_file))
+        dmap = pydarnio.SDarnRead(test_file)
         dmap_data = dmap.read_grid()
         self.dmap_compare(dmap_stream_data, dmap_data)
 
@@ -617,52 +625,50 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead reading a grid file then writing it with SDarnWrite
         then reading it again with SDarnRead
         """
+        test_file = self.tmp_file("test_grid.grid")
         dmap = pydarnio.DmapRead(grid_file)
         dmap_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_grid("test_grid.grid")
-        darn_read = pydarnio.SDarnRead("test_grid.grid")
+        dmap_write.write_grid(test_file)
+        darn_read = pydarnio.SDarnRead(test_file)
         grid_data = darn_read.read_grid()
         self.dmap_compare(dmap_data, grid_data)
-        os.remove("test_grid.grid")
 
     def test_SDarnWrite_file_SDarnRead_grid(self):
         """
         Test SDarnWrite to write a grid file then using
         SDarnRead to read the file
         """
-        grid_data = copy.deepcopy(grid_data_sets.grid_data)
-        grid_write = pydarnio.SDarnWrite(grid_data, "test_grid.grid")
+        test_file = self.tmp_file("test_grid.grid")
+        grid_data = copy_records(grid_data_sets.get_grid_data())
+        grid_write = pydarnio.SDarnWrite(grid_data, test_file)
         grid_write.write_grid()
 
-        grid_read = pydarnio.SDarnRead("test_grid.grid")
+        grid_read = pydarnio.SDarnRead(test_file)
         grid_read_data = grid_read.read_grid()
         self.dmap_compare(grid_read_data, grid_data)
-        os.remove("test_grid.grid")
 
     def test_DmapWrite_SDarnRead_grid(self):
         """
         Test DmapWrite to write a grid file then using SDarnRead
         to read the file
         """
-        grid_data = copy.deepcopy(grid_data_sets.grid_data)
-        grid_write = pydarnio.DmapWrite(grid_data, "test_grid.grid")
+        test_file = self.tmp_file("test_grid.grid")
+        grid_data = copy_records(grid_data_sets.get_grid_data())
+        grid_write = pydarnio.DmapWrite(grid_data, test_file)
         grid_write.write_dmap()
 
-        grid_read = pydarnio.SDarnRead("test_grid.grid")
+        grid_read = pydarnio.SDarnRead(test_file)
         grid_read_data = grid_read.read_grid()
         self.dmap_compare(grid_read_data, grid_data)
-        os.remove("test_grid.grid")
 
     def test_SDarnRead_DmapWrite_stream_grid(self):
         """
         Test SDarnRead to read from a grid stream then
         DmapWrite to write a grid file from the stream
         """
-        with bz2.open(grid_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        dmap_stream_data = dmap.read_grid()
+        dmap = read_darn_stream(grid_stream, pydarnio.SDarnRead.read_grid)
+        dmap_stream_data = dmap.get_records
         dmap_write = pydarnio.DmapWrite()
         dmap_write_stream = dmap_write.write_dmap_stream(dmap_stream_data)
         dmap_read = pydarnio.SDarnRead(dmap_write_stream, True)
@@ -674,23 +680,22 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead to read in a stream then have SDarnWrite the
         stream to file
         """
-        with bz2.open(grid_stream) as fp:
-            dmap_stream = fp.read()
+        test_file = self.tmp_file("test_grid.grid")
+        dmap_stream = read_stream(grid_stream)
         dmap = pydarnio.DmapRead(dmap_stream, True)
         dmap_stream_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_stream_data)
-        dmap_write.write_grid("test_grid.grid")
-        dmap = pydarnio.SDarnRead("test_grid.grid")
+        dmap_write.write_grid(test_file)
+        dmap = pydarnio.SDarnRead(test_file)
         dmap_data = dmap.read_grid()
         self.dmap_compare(dmap_stream_data, dmap_data)
-        os.remove("test_grid.grid")
 
     def test_DmapWrite_stream_SDarnRead_grid(self):
         """
         Test DmapWrite to write to a stream and have SDarnRead
         the grid stream
         """
-        grid_data = copy.deepcopy(grid_data_sets.grid_data)
+        grid_data = copy_records(grid_data_sets.get_grid_data())
         grid_write = pydarnio.DmapWrite()
         grid_stream = grid_write.write_dmap_stream(grid_data)
 
@@ -698,89 +703,61 @@ class IntegrationSuperdarnio(unittest.TestCase):
         grid_read_data = grid_read.read_grid()
         self.dmap_compare(grid_read_data, grid_data)
 
-    def test_DmapWrite_missing_SDarnRead_grid(self):
-        """
-        Test DmapWrite writes a grid file missing the field nave in record 2
-        and SDarnRead reads the file
-
-        Behaviour: Raise SuperDARNFieldMissingError
-        """
-        grid_missing_field = copy.deepcopy(grid_data_sets.grid_data)
-        del grid_missing_field[0]['stid']
-        dmap_write = pydarnio.DmapWrite(grid_missing_field)
-        dmap_write.write_dmap("test_missing_grid.grid")
-
-        darn_read = pydarnio.SDarnRead("test_missing_grid.grid")
-        try:
-            darn_read.read_grid()
-        except pydarnio.superdarn_exceptions.SuperDARNFieldMissingError as err:
-            self.assertEqual(err.fields, {'stid'})
-            self.assertEqual(err.record_number, 0)
-
-        os.remove("test_missing_grid.grid")
-
-    def test_DmapWrite_extra_SDarnRead_grid(self):
+    def test_DmapWrite_malformed_SDarnRead_grid(self):
         """
-        Test DmapWrite writes a grid file with an extra field and SDarnRead
-        reads the file
+        Test DmapWrite writes grid streams missing the field stid or with an
+        extra field in the first record and SDarnRead reads the streams
 
-        Behaviour: Raised SuperDARNExtraFieldError
+        Behaviour: Raise SuperDARNFieldMissingError and
+                   SuperDARNExtraFieldError
         """
-        grid_extra_field = copy.deepcopy(grid_data_sets.grid_data)
-        grid_extra_field[0].update({'dummy': 'dummy'})
-        grid_extra_field[0].move_to_end('dummy', last=False)
-        dmap_write = pydarnio.DmapWrite(grid_extra_field, )
-        dmap_write.write_dmap("test_extra_grid.grid")
-
-        darn_read = pydarnio.SDarnRead("test_extra_grid.grid")
-        try:
-            darn_read.read_grid()
-        except pydarnio.superdarn_exceptions.SuperDARNExtraFieldError as err:
-            self.assertEqual(err.fields, {'dummy'})
-            self.assertEqual(err.record_number, 0)
-        os.remove("test_extra_grid.grid")
+        grid_data = grid_data_sets.get_grid_data()
+        read_grid = pydarnio.SDarnRead.read_grid
+        with self.subTest(kind='missing'):
+            self.check_missing_field(grid_data, 'stid', read_grid)
+        with self.subTest(kind='extra'):
+            self.check_extra_field(grid_data, read_grid)
 
     def test_SDarnRead_SDarnWrite_map(self):
         """
         Test DmapRead reading an map and SDarnWrite writing
         the map file
         """
+        test_file = self.tmp_file("test_map.map")
         dmap = pydarnio.SDarnRead(map_file)
         dmap_data = dmap.read_map()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_map("test_map.map")
-        map_read = pydarnio.SDarnRead("test_map.map")
+        dmap_write.write_map(test_file)
+        map_read = pydarnio.SDarnRead(test_file)
         map_read_data = map_read.read_map()
         self.dmap_compare(dmap_data, map_read_data)
-        os.remove("test_map.map")
 
     def test_SDarnWrite_SDarnRead_map(self):
         """
         Test SDarnWrite writing a map file and SDarnRead reading the map
         file
         """
-        map_data = copy.deepcopy(map_data_sets.map_data)
-        map_write = pydarnio.SDarnWrite(map_data, "test_map.map")
+        test_file = self.tmp_file("test_map.map")
+        map_data = copy_records(map_data_sets.map_data)
+        map_write = pydarnio.SDarnWrite(map_data, test_file)
         map_write.write_map()
 
-        map_read = pydarnio.SDarnRead("test_map.map")
+        map_read = pydarnio.SDarnRead(test_file)
         map_read_data = map_read.read_map()
         self.dmap_compare(map_read_data, map_data)
-        os.remove("test_map.map")
 
     def test_SDarnRead_stream_SDarnWrite_file_map(self):
         """
         Test SDarnRead reads from a stream and SDarnWrite writes
         to a map file
         """
-        with bz2.open(map_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        dmap_stream_data = dmap.read_map()
+        test_file = self.tmp_file("test_map.map")
+        dmap = read_darn_stream(map_stream, pydarnio.SDarnRead.read_map)
+        dmap_stream_data = dmap.get_records
         dmap_write = pydarnio.SDarnWrite(dmap_stream_data)
-        dmap_write.write_map("test_map.map")
-        self.assertTrue(os.path.isfile("test_map.map"))
-        dmap = pydarnio.SDarnRead("test_map.map")
+        dmap_write.write_map(test_file)
+        self.assertTrue(os.path.isfile(test_file))
+        dmap = pydarnio.SDarnRead(test_file)
         dmap_data = dmap.read_map()
         self.dmap_compare(dmap_stream_data, dmap_data)
 
@@ -789,52 +766,50 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead reading a map file then writing it with SDarnWrite
         then reading it again with SDarnRead
         """
+        test_file = self.tmp_file("test_map.map")
         dmap = pydarnio.DmapRead(map_file)
         dmap_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_data)
-        dmap_write.write_map("test_map.map")
-        darn_read = pydarnio.SDarnRead("test_map.map")
+        dmap_write.write_map(test_file)
+        darn_read = pydarnio.SDarnRead(test_file)
         map_data = darn_read.read_map()
         self.dmap_compare(dmap_data, map_data)
-        os.remove("test_map.map")
 
     def test_SDarnWrite_file_SDarnRead_map(self):
         """
         Test SDarnWrite to write a map file then using
         SDarnRead to read the file
         """
-        map_data = copy.deepcopy(map_data_sets.map_data)
-        map_write = pydarnio.SDarnWrite(map_data, "test_map.map")
+        test_file = self.tmp_file("test_map.map")
+        map_data = copy_records(map_data_sets.map_data)
+        map_write = pydarnio.SDarnWrite(map_data, test_file)
         map_write.write_map()
 
-        map_read = pydarnio.SDarnRead("test_map.map")
+        map_read = pydarnio.SDarnRead(test_file)
         map_read_data = map_read.read_map()
         self.dmap_compare(map_read_data, map_data)
-        os.remove("test_map.map")
 
     def test_DmapWrite_SDarnRead_map(self):
         """
         Test DmapWrite to write a map file then using SDarnRead
         to read the file
         """
-        map_data = copy.deepcopy(map_data_sets.map_data)
-        map_write = pydarnio.DmapWrite(map_data, "test_map.map")
+        test_file = self.tmp_file("test_map.map")
+        map_data = copy_records(map_data_sets.map_data)
+        map_write = pydarnio.DmapWrite(map_data, test_file)
         map_write.write_dmap()
 
-        map_read = pydarnio.SDarnRead("test_map.map")
+        map_read = pydarnio.SDarnRead(test_file)
         map_read_data = map_read.read_map()
         self.dmap_compare(map_read_data, map_data)
-        os.remove("test_map.map")
 
     def test_SDarnRead_DmapWrite_stream_map(self):
         """
         Test SDarnRead to read from a map stream then
         DmapWrite to write a map file from the stream
         """
-        with bz2.open(map_stream) as fp:
-            dmap_stream = fp.read()
-        dmap = pydarnio.SDarnRead(dmap_stream, True)
-        dmap_stream_data = dmap.read_map()
+        dmap = read_darn_stream(map_stream, pydarnio.SDarnRead.read_map)
+        dmap_stream_data = dmap.get_records
         dmap_write = pydarnio.DmapWrite()
         dmap_write_stream = dmap_write.write_dmap_stream(dmap_stream_data)
         dmap_read = pydarnio.SDarnRead(dmap_write_stream, True)
@@ -846,23 +821,22 @@ class IntegrationSuperdarnio(unittest.TestCase):
         Test DmapRead to read in a stream then have SDarnWrite the
         stream to file
         """
-        with bz2.open(map_stream) as fp:
-            dmap_stream = fp.read()
+        test_file = self.tmp_file("test_map.map")
+        dmap_stream = read_stream(map_stream)
         dmap = pydarnio.DmapRead(dmap_stream, True)
         dmap_stream_data = dmap.read_records()
         dmap_write = pydarnio.SDarnWrite(dmap_stream_data)
-        dmap_write.write_map("test_map.map")
-        dmap = pydarnio.SDarnRead("test_map.map")
+        dmap_write.write_map(test_file)
+        dmap = pydarnio.SDarnRead(test_file)
         dmap_data = dmap.read_map()
         self.dmap_compare(dmap_stream_data, dmap_data)
-        os.remove("test_map.map")
 
     def test_DmapWrite_stream_SDarnRead_map(self):
         """
         Test DmapWrite to write to a stream and have SDarnRead
         the map stream
         """
-        map_data = copy.deepcopy(map_data_sets.map_data)
+        map_data = copy_records(map_data_sets.map_data)
         map_write = pydarnio.DmapWrite()
         map_stream = map_write.write_dmap_stream(map_data)
 
@@ -870,47 +844,20 @@ class IntegrationSuperdarnio(unittest.TestCase):
         map_read_data = map_read.read_map()
         self.dmap_compare(map_read_data, map_data)
 
-    def test_DmapWrite_missing_SDarnRead_map(self):
+    def test_DmapWrite_malformed_SDarnRead_map(self):
         """
-        Test DmapWrite writes a fitacf file missing the field nave in record 2
-        and SDarnRead reads the file
+        Test DmapWrite writes map streams missing the field stid or with an
+        extra field in the first record and SDarnRead reads the streams
 
-        Behaviour: Raise SuperDARNFieldMissingError
+        Behaviour: Raise SuperDARNFieldMissingError and
+                   SuperDARNExtraFieldError
         """
-        map_missing_field = copy.deepcopy(map_data_sets.map_data)
-        del map_missing_field[0]['stid']
-        dmap_write = pydarnio.DmapWrite(map_missing_field)
-        dmap_write.write_dmap("test_missing_map.map")
-
-        darn_read = pydarnio.SDarnRead("test_missing_map.map")
-        try:
-            darn_read.read_map()
-        except pydarnio.superdarn_exceptions.SuperDARNFieldMissingError as err:
-            self.assertEqual(err.fields, {'stid'})
-            self.assertEqual(err.record_number, 0)
-
-        os.remove("test_missing_map.map")
-
-    def test_DmapWrite_extra_SDarnRead_map(self):
-        """
-        Test DmapWrite writes a map file with an extra field and SDarnRead
-        reads the file
-
-        Behaviour: Raised SuperDARNExtraFieldError
-        """
-        map_extra_field = copy.deepcopy(map_data_sets.map_data)
-        map_extra_field[0].update({'dummy': 'dummy'})
-        map_extra_field[0].move_to_end('dummy', last=False)
-        dmap_write = pydarnio.DmapWrite(map_extra_field, )
-        dmap_write.write_dmap("test_extra_map.map")
-
-        darn_read = pydarnio.SDarnRead("test_extra_map.map")
-        try:
-            darn_read.read_map()
-        except pydarnio.superdarn_exceptions.SuperDARNExtraFieldError as err:
-            self.assertEqual(err.fields, {'dummy'})
-            self.assertEqual(err.record_number, 0)
-        os.remove("test_extra_map.map")
+        map_data = map_data_sets.map_data
+        read_map = pydarnio.SDarnRead.read_map
+        with self.subTest(kind='missing'):
+            self.check_missing_field(map_data, 'stid', read_map)
+        with self.subTest(kind='extra'):
+            self.check_extra_field(map_data, read_map)
 
 
 if __name__ == '__main__':
@@ -16,17 +16,22 @@ And supports conversion of the following Borealis -> SDARN DMap types:
 """
 import collections
 import copy
+import h5py
 import logging
 import numpy as np
 import os
 import pytest
 import random
 import tables
+import tempfile
 import unittest
 
 import pydarnio
 
 from collections import OrderedDict
+from datetime import datetime
+
+from pydarnio.borealis.base_format import BaseFormat
 
 from borealis_rawacf_data_sets import (borealis_array_rawacf_data,
                                        borealis_site_rawacf_data)
@@ -906,6 +911,343 @@ class TestBorealisConvert(unittest.TestCase):
         os.remove("test_bfiq.bfiq.dmap")
 
 
+class TestBorealisConvertRecords(unittest.TestCase):
+    """
+    Tests the conversion of single Borealis records to SDARN DMap records
+    """
+
+    def setUp(self):
+        self.bfiq_site_data = copy.deepcopy(borealis_site_bfiq_data)
+
+    def test_bfiq_record_to_iqdat_data(self):
+        """
+        Tests the iqdat data of a converted bfiq record against the complex
+        division by the normalization factor
+
+        Expected behaviour
+        ------------------
+        The int16 iqdat samples are the same as dividing the complex64 bfiq
+        data by the (not a power of two) normalization factor, scaling to
+        the int16 max, limiting to the int16 range and truncating.
+        """
+        record_key = list(self.bfiq_site_data.keys())[0]
+        record = self.bfiq_site_data[record_key]
+        norm = record['data_normalization_factor']
+        # samples on the int16 steps, where a rounding difference in the
+        # scaling changes the truncated value
+        steps = np.arange(-record['data'].size, record['data'].size) % \
+            65536 - 32768
+        record['data'] = (steps * (norm / 32767)).astype(np.float32).\
+            view(np.complex64)
+
+        for scaling_factor in [1, 3]:
+            expected = record['data'].reshape(record['data_dimensions']) / \
+                norm * np.iinfo(np.int16).max * scaling_factor
+            expected = np.clip(expected.view(np.float32).astype(np.float64),
+                               -32768, 32767).astype(np.int16)
+            iqdat_records = pydarnio.BorealisConvert._convert_bfiq_record(
+                0, (record_key, record), 'test', scaling_factor)
+            self.assertEqual(len(iqdat_records), len(record['beam_nums']))
+            for beam_index, iqdat_record in enumerate(iqdat_records):
+                # num_sequences x num_antenna_arrays x num_samps x 2
+                beam_data = expected[:, :, beam_index, :].transpose(1, 0, 2)
+                self.assertEqual(iqdat_record['data'].dtype, np.int16)
+                np.testing.assert_array_equal(iqdat_record['data'],
+                                              np.ravel(beam_data))
+
+
+class TestBorealisConvertProcesses(unittest.TestCase):
+    """
+    Tests converting Borealis files with more than one worker process
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write_site_file(self, data: dict, filetype: str) -> str:
+        """
+        Writes the test records to a Borealis site file in the temporary
+        directory, converting the fields the test data sets give in older
+        types.
+        """
+        records = copy.deepcopy(data)
+        rng = np.random.default_rng(0)
+        for record in records.values():
+            for field, value in record.items():
+                if isinstance(value, np.str_):
+                    record[field] = str(value)
+                elif np.iscomplexobj(value):
+                    # random samples, the test data sets hold zeros
+                    record[field] = (rng.standard_normal(value.shape) + 1j *
+                                     rng.standard_normal(value.shape)).\
+                        astype(value.dtype)
+            record['scan_start_marker'] = \
+                np.uint8(record['scan_start_marker'])
+        filename = os.path.join(self.tmp_dir.name,
+                                'test.{}.hdf5.site'.format(filetype))
+        _ = pydarnio.BorealisWrite(filename, records, filetype, 'site')
+        return filename
+
+    def convert(self, filename: str, filetype: str, processes: int):
+        """
+        Converts the Borealis file with the given number of processes and
+        returns the converter and the bytes of the SDARN DMap file written.
+        """
+        sdarn_filename = os.path.join(self.tmp_dir.name,
+                                      'test_{}.dmap'.format(processes))
+        converter = pydarnio.BorealisConvert(filename, filetype,
+                                             sdarn_filename,
+                                             borealis_slice_id=0,
+                                             borealis_file_structure='site',
+                                             processes=processes)
+        with open(sdarn_filename, 'rb') as sdarn_file:
+            return converter, sdarn_file.read()
+
+    def check_processes_same_output(self, data: dict, filetype: str):
+        """
+        Checks converting with two processes gives the same records and
+        file as converting in this process.
+        """
+        filename = self.write_site_file(data, filetype)
+        converter, sdarn_bytes = self.convert(filename, filetype, 1)
+        pool_converter, pool_sdarn_bytes = self.convert(filename, filetype,
+                                                        2)
+        self.assertEqual(pool_converter.processes, 2)
+        self.assertEqual(len(pool_converter.sdarn_dmap_records),
+                         len(converter.sdarn_dmap_records))
+        for record, pool_record in zip(converter.sdarn_dict,
+                                       pool_converter.sdarn_dict):
+            self.assertEqual(list(record.keys()), list(pool_record.keys()))
+            for field, value in record.items():
+                np.testing.assert_array_equal(pool_record[field], value)
+        self.assertEqual(pool_sdarn_bytes, sdarn_bytes)
+
+    def test_processes_rawacf(self):
+        """
+        Tests converting rawacf with two processes
+
+        Expected behaviour
+        ------------------
+        The SDARN rawacf records and file are the same as with one process
+        """
+        self.check_processes_same_output(borealis_site_rawacf_data,
+                                         'rawacf')
+
+    def test_processes_bfiq(self):
+        """
+        Tests converting bfiq with two processes
+
+        Expected behaviour
+        ------------------
+        The SDARN iqdat records and file are the same as with one process
+        """
+        self.check_processes_same_output(borealis_site_bfiq_data, 'bfiq')
+
+    def test_invalid_processes(self):
+        """
+        Tests BorealisConvert with a number of processes that is not a
+        positive integer
+
+        Expected behaviour
+        ------------------
+        Raises ValueError before the Borealis file is read
+        """
+        filename = os.path.join(self.tmp_dir.name, 'missing.rawacf.hdf5')
+        for processes in [0, -2, None, 2.0, '2', True]:
+            with self.subTest(processes=processes):
+                with self.assertRaises(ValueError):
+                    pydarnio.BorealisConvert(filename, 'rawacf',
+                                             'test_rawacf.rawacf.dmap',
+                                             borealis_slice_id=0,
+                                             processes=processes)
+
+
+class TestBorealisBaseFormat(unittest.TestCase):
+    """
+    Tests the HDF5 read helpers and record keys of BaseFormat
+    """
+
+    # attributes written by PyTables and deepdish, not Borealis fields
+    bookkeeping_attributes = ['CLASS', 'TITLE', 'VERSION',
+                              'DEEPDISH_IO_VERSION',
+                              'PYTABLES_FORMAT_VERSION']
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.filename = os.path.join(self.tmp_dir.name, 'test.hdf5')
+
+        self.attributes = {
+            'experiment_name': np.bytes_('normalscan'),
+            'station': np.bytes_('sas'),
+            'experiment_comment': np.bytes_(''),
+            'slice_comment': 'variable length string',
+            'experiment_id': np.int64(151),
+            'num_sequences': np.uint32(29),
+            'first_range': np.float32(180.0),
+            'rx_sample_rate': np.float64(3333.3333333333335),
+            'scan_start_marker': np.bool_(True),
+            'pulses': np.array([0, 9, 12, 20, 22, 26, 27], dtype=np.uint32),
+            'beam_azms': np.array([-3.24, 0.0, 3.24]),
+            'lags': np.array([[0, 0], [26, 27], [20, 22]], dtype=np.uint32),
+            'noise': h5py.Empty(np.float32),
+            'empty_comment': h5py.Empty('S10'),
+        }
+        self.datasets = {
+            'data': (np.arange(24) + 1j * np.arange(24)).
+            astype(np.complex64).reshape(2, 3, 4),
+            'sqn_timestamps': 1597874400.123456 + np.arange(5) * 0.0371,
+            'beam_nums': np.array([0, 1, 2], dtype=np.uint32),
+            'blanked_samples': np.array([], dtype=np.uint32),
+        }
+        self.strings = np.array(['main', 'intf'])
+
+        with h5py.File(self.filename, 'w') as f:
+            for group_name in ['1597874400123', '1597874403123']:
+                group = f.create_group(group_name)
+                for name in self.bookkeeping_attributes:
+                    group.attrs[name] = np.bytes_('pytables')
+                for name, value in self.attributes.items():
+                    group.attrs[name] = value
+                for name, value in self.datasets.items():
+                    group.create_dataset(name, data=value)
+                # strings are stored as bytes, as in BaseFormat.write_records
+                dset = group.create_dataset(
+                    'antenna_arrays_order',
+                    data=self.strings.view(dtype=np.uint8))
+                dset.attrs['strtype'] = b'unicode'
+                dset.attrs['itemsize'] = self.strings.dtype.itemsize // 4
+
+    def expected_attributes(self, group: h5py.Group) -> dict:
+        """
+        Reads the attributes of the group through h5py's attrs, with
+        strings decoded and the bookkeeping attributes skipped.
+        """
+        attribute_dict = {}
+        for k, v in group.attrs.items():
+            if k in self.bookkeeping_attributes:
+                continue
+            elif isinstance(v, bytes):
+                attribute_dict[k] = v.decode('utf-8')
+            elif isinstance(v, h5py.Empty):
+                data = v.dtype.type()
+                if isinstance(data, bytes):
+                    data = data.decode('utf-8')
+                attribute_dict[k] = data
+            else:
+                attribute_dict[k] = v
+        return attribute_dict
+
+    def check_attributes_equal(self, attributes: dict, expected: dict):
+        """
+        Checks the read attributes have the names, types and values
+        expected.
+        """
+        self.assertEqual(sorted(attributes.keys()), sorted(expected.keys()))
+        for name, value in expected.items():
+            with self.subTest(attribute=name):
+                self.assertEqual(type(attributes[name]), type(value))
+                if isinstance(value, np.ndarray):
+                    self.assertEqual(attributes[name].dtype, value.dtype)
+                np.testing.assert_array_equal(attributes[name], value)
+
+    def test_read_attributes(self):
+        """
+        Tests reading the attributes of a group
+
+        Expected behaviour
+        ------------------
+        Same attributes as h5py's attrs, strings as unicode strings, empty
+        attributes as the zero of their type and no bookkeeping attributes
+        """
+        with h5py.File(self.filename, 'r') as f:
+            group = f['1597874400123']
+            attributes = BaseFormat.read_attributes(group)
+            expected = self.expected_attributes(group)
+        self.check_attributes_equal(attributes, expected)
+        self.assertEqual(attributes['station'], 'sas')
+        self.assertEqual(attributes['experiment_comment'], '')
+        self.assertEqual(attributes['slice_comment'],
+                         'variable length string')
+        self.assertEqual(attributes['empty_comment'], '')
+        for name in self.bookkeeping_attributes:
+            self.assertNotIn(name, attributes)
+
+    def test_read_attributes_shared_caches(self):
+        """
+        Tests reading the attributes of several groups with shared memory
+        type and string caches
+
+        Expected behaviour
+        ------------------
+        The attributes are the same as without the caches, which hold the
+        memory types and decoded strings of the groups read
+        """
+        mtypes = {}
+        strings = {}
+        with h5py.File(self.filename, 'r') as f:
+            for group_name in f.keys():
+                group = f[group_name]
+                attributes = BaseFormat.read_attributes(group, mtypes,
+                                                        strings)
+                self.check_attributes_equal(attributes,
+                                            self.expected_attributes(group))
+                self.check_attributes_equal(
+                    attributes, BaseFormat.read_attributes(group))
+        self.assertIn(np.dtype(np.int64), mtypes)
+        self.assertIn(np.dtype(np.float64), mtypes)
+        self.assertEqual(strings[b'station'], 'station')
+        self.assertEqual(strings[b'sas'], 'sas')
+        self.assertEqual(strings[b'normalscan'], 'normalscan')
+
+    def test_read_dataset(self):
+        """
+        Tests reading the datasets of a group
+
+        Expected behaviour
+        ------------------
+        Same data as reading the h5py Dataset, and string datasets as
+        unicode strings
+        """
+        with h5py.File(self.filename, 'r') as f:
+            group = f['1597874400123']
+            for name, value in self.datasets.items():
+                with self.subTest(dataset=name):
+                    data = BaseFormat.read_dataset(group, name)
+                    expected = group[name][()]
+                    self.assertEqual(data.dtype, expected.dtype)
+                    self.assertEqual(data.shape, expected.shape)
+                    np.testing.assert_array_equal(data, expected)
+                    np.testing.assert_array_equal(data, value)
+            data = BaseFormat.read_dataset(group, 'antenna_arrays_order')
+        self.assertEqual(data.dtype, self.strings.dtype)
+        np.testing.assert_array_equal(data, self.strings)
+
+    def test_site_record_keys(self):
+        """
+        Tests the site record keys of first sequence timestamps
+
+        Expected behaviour
+        ------------------
+        Same keys as the ms since epoch of the timestamps as datetimes,
+        as formatted in datawrite on site
+        """
+        rng = np.random.default_rng(0)
+        timestamps = np.concatenate([
+            1597874400.123456 + np.arange(100) * 3.0371,
+            rng.uniform(1.5e9, 1.8e9, 1000),
+            # within half a microsecond of a millisecond
+            1597874400 + np.arange(1, 100) * 0.001 - 4e-7,
+            1597874400 + np.arange(1, 100) * 0.001 + 4e-7,
+            [0.0, 1.0, 1597874400.0, 1597874400.9999996]])
+        epoch = datetime.utcfromtimestamp(0)
+        expected = [str(int((datetime.utcfromtimestamp(timestamp) -
+                             epoch).total_seconds() * 1000))
+                    for timestamp in timestamps]
+        self.assertEqual(BaseFormat.site_record_keys(timestamps), expected)
+
+
 if __name__ == '__main__':
     """
     Runs the above class in a unittest system.